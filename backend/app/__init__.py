@@ -1,3 +1,5 @@
+import atexit
+
 from dotenv import load_dotenv
 from flask import Flask, jsonify
 from pymongo import MongoClient
@@ -5,6 +7,15 @@ from pymongo import MongoClient
 from .config import Config
 from .extensions import cors
 from .api import api_bp
+from .llm import build_gateway
+from .mcp import McpHealthMonitor, McpWarmup, build_clients, close_clients
+from .services.blueprint_cache import BlueprintCache
+from .services.brief_index import BriefIndex
+from .services.database_service import DatabaseService
+from .services.form_batch_service import build_rate_limiters
+from .services.form_generation_service import run_form_generation
+from .services.form_jobs import FormJobQueue
+from .services.user_cache import UserCache
 
 
 def create_app():
@@ -37,6 +48,49 @@ def create_app():
     else:
         print("⚠️  No MongoDB URI provided")
         app.db = None
+
+    # Unique indexes back every user lookup and make duplicate sign-ups fail
+    DatabaseService.ensure_indexes(app.db)
+    app.user_cache = UserCache(size=app.config["USER_CACHE_SIZE"], ttl=app.config["USER_CACHE_TTL"])
+
+    # One pooled OpenAI client for the whole app; tests can replace app.llm
+    app.llm = build_gateway(app.config)
+    atexit.register(app.llm.close)
+
+    app.blueprint_cache = BlueprintCache(
+        app.db,
+        size=app.config["BLUEPRINT_CACHE_SIZE"],
+        ttl=app.config["BLUEPRINT_CACHE_TTL"],
+    )
+    app.blueprint_cache.ensure_indexes()
+    app.brief_index = BriefIndex(
+        threshold=app.config["BLUEPRINT_SIMILARITY_THRESHOLD"],
+        size=app.config["BLUEPRINT_SIMILARITY_INDEX_SIZE"],
+    )
+    if app.brief_index.enabled:
+        for key, inputs, questions in app.blueprint_cache.recent(app.brief_index.size):
+            app.brief_index.add(key, inputs, questions)
+
+    # Job mode runs generation off the request thread on a bounded pool
+    app.form_jobs = FormJobQueue(
+        app,
+        run_form_generation,
+        workers=app.config["FORM_JOB_WORKERS"],
+        queue_size=app.config["FORM_JOB_QUEUE_SIZE"],
+        ttl=app.config["FORM_JOB_TTL"],
+    )
+    app.form_jobs.ensure_indexes()
+    atexit.register(app.form_jobs.shutdown)
+    app.rate_limiters = build_rate_limiters(app.config)
+
+    # MCP clients are shared by every request; child processes start lazily
+    app.mcp_clients = build_clients(app.config)
+    atexit.register(close_clients, app.mcp_clients)
+    app.mcp_warmup = McpWarmup(app.mcp_clients, enabled=app.config["MCP_WARMUP_ON_START"])
+    app.mcp_warmup.start()
+    app.mcp_health = McpHealthMonitor(app.mcp_clients, interval=app.config["MCP_HEALTH_INTERVAL"])
+    app.mcp_health.start()
+    atexit.register(app.mcp_health.stop)
       # Add a root route
     @app.route("/")
     def index():
@@ -5,6 +5,7 @@ from .login import login_bp
 from .register import register_bp
 from .google_auth import google_auth_bp
 from .mcp_routes import mcp_bp
+from .forms_routes import forms_bp
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 api_bp.register_blueprint(users_bp)
@@ -12,3 +13,4 @@ api_bp.register_blueprint(login_bp)
 api_bp.register_blueprint(register_bp)
 api_bp.register_blueprint(google_auth_bp)
 api_bp.register_blueprint(mcp_bp)
+api_bp.register_blueprint(forms_bp)
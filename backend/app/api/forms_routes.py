@@ -1,19 +1,143 @@
-from flask import Blueprint, jsonify, request
+import json
+import time
 
-from ..services.form_generation_service import create_form_from_blueprint, generate_form_blueprint
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+
+from ..services.blueprint_schema import REPAIR_STATS
+from ..services.form_batch_service import parse_briefs, run_batch
+from ..services.form_generation_service import (
+    get_blueprint_cache,
+    get_brief_index,
+    get_form_jobs,
+    run_form_generation,
+    stream_form_generation,
+)
+from ..services.llm_service import get_llm_stats
 
 forms_bp = Blueprint("forms", __name__)
 
 
+def _error_status(result):
+    error = str(result.get("error", ""))
+    if error.startswith("llm_"):
+        return 502
+    if error == "form_create_failed":
+        return 500
+    return 400
+
+
 @forms_bp.post("/forms/generate")
 def generate_form():
     payload = request.get_json(silent=True) or {}
-    draft = generate_form_blueprint(payload)
-    if not draft.get("ok"):
-        return jsonify(draft), 400
+    if "fresh" in request.args:
+        payload["fresh"] = request.args.get("fresh")
+
+    if request.args.get("async") in ("1", "true") or payload.get("async") is True:
+        queued = get_form_jobs().submit(payload)
+        if not queued.get("ok"):
+            return jsonify(queued), 503
+        job = queued["job"]
+        return jsonify({"ok": True, "job": job, "status_url": f"/api/forms/jobs/{job['id']}"}), 202
 
-    created = create_form_from_blueprint(draft["blueprint"])
+    created = run_form_generation(payload)
     if not created.get("ok"):
-        return jsonify(created), 500
+        return jsonify(created), _error_status(created)
 
     return jsonify(created)
+
+
+def _event_stream(events):
+    def render():
+        for event in events:
+            yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
+    return Response(
+        stream_with_context(render()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@forms_bp.post("/forms/batch")
+def generate_forms_batch():
+    upload = request.files.get("file")
+    if upload is not None:
+        briefs, error = parse_briefs(None, upload.read().decode("utf-8-sig"))
+    elif request.mimetype == "text/csv":
+        briefs, error = parse_briefs(None, request.get_data(as_text=True))
+    else:
+        briefs, error = parse_briefs(request.get_json(silent=True))
+    if error:
+        return jsonify({"ok": False, "error": error}), 400
+
+    return _event_stream(run_batch(briefs))
+
+
+@forms_bp.get("/forms/jobs")
+def form_job_stats():
+    return jsonify(get_form_jobs().stats())
+
+
+@forms_bp.get("/forms/jobs/<job_id>")
+def get_form_job(job_id):
+    job = get_form_jobs().get(job_id)
+    if job is None:
+        return jsonify({"ok": False, "error": "job_not_found"}), 404
+    return jsonify({"ok": True, "job": job})
+
+
+@forms_bp.get("/forms/jobs/<job_id>/events")
+def form_job_events(job_id):
+    jobs = get_form_jobs()
+    if jobs.get(job_id) is None:
+        return jsonify({"ok": False, "error": "job_not_found"}), 404
+
+    # The stream holds a web worker while it polls, so it is capped; clients
+    # reconnect (EventSource does so on its own) or fall back to polling
+    deadline = time.monotonic() + current_app.config.get("FORM_JOB_EVENTS_TIMEOUT", 60)
+
+    def events():
+        last = None
+        while True:
+            job = jobs.get(job_id)
+            if job is None:
+                return
+            state = (job["status"], job.get("stage"))
+            if state != last:
+                last = state
+                yield f"event: {job['status']}\ndata: {json.dumps(job)}\n\n"
+            if job["status"] not in ("queued", "running"):
+                return
+            if time.monotonic() >= deadline:
+                yield f"event: timeout\ndata: {json.dumps(job)}\n\n"
+                return
+            time.sleep(0.5)
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@forms_bp.post("/forms/generate/stream")
+def generate_form_stream():
+    payload = request.get_json(silent=True) or {}
+    if "fresh" in request.args:
+        payload["fresh"] = request.args.get("fresh")
+
+    return _event_stream(stream_form_generation(payload))
+
+
+@forms_bp.get("/forms/cache")
+def blueprint_cache_stats():
+    stats = get_blueprint_cache().stats()
+    stats["similarity"] = get_brief_index().stats()
+    return jsonify(stats)
+
+
+@forms_bp.get("/forms/llm")
+def llm_stats():
+    stats = get_llm_stats()
+    stats["blueprints"] = REPAIR_STATS.snapshot()
+    return jsonify(stats)
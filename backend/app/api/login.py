@@ -27,13 +27,13 @@ def login():
         if "@" in username_or_email:
             # Looks like an email
             email = username_or_email.lower().strip()
-            user = DatabaseService.find_one("users", {"email": email})
+            user = DatabaseService.find_one("users", {"email": email}, projection="user_auth")
         else:
             # Looks like a username, try both username and email fields
             username = username_or_email.strip()
-            user = DatabaseService.find_one("users", {"username": username})
+            user = DatabaseService.find_one("users", {"username": username}, projection="user_auth")
             if not user:
-                user = DatabaseService.find_one("users", {"email": username.lower()})
+                user = DatabaseService.find_one("users", {"email": username.lower()}, projection="user_auth")
         
         if not user:
             return jsonify({
@@ -100,18 +100,16 @@ def verify_token():
             payload = jwt.decode(token, secret_key, algorithms=["HS256"])
             user_id = payload["user_id"]
             
-            user = DatabaseService.find_one("users", {"_id": ObjectId(user_id)})
+            user = DatabaseService.find_one("users", {"_id": ObjectId(user_id)}, projection="user_public")
             if not user:
                 return jsonify({
                     "success": False,
                     "error": "User not found"
                 }), 401
             
-            user_data = {k: v for k, v in user.items() if k != "password"}
-            
             return jsonify({
                 "success": True,
-                "user": user_data
+                "user": user
             }), 200
             
         except jwt.ExpiredSignatureError:
@@ -1,6 +1,15 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 
-from ..services.mcp_service import call_mcp, call_mcp_tool, get_mcp_status
+from ..services.mcp_service import (
+    call_mcp,
+    call_mcp_tool,
+    get_mcp_metrics,
+    get_mcp_metrics_prometheus,
+    get_mcp_readiness,
+    get_mcp_stats,
+    get_mcp_status,
+    list_mcp_tools,
+)
 
 mcp_bp = Blueprint("mcp", __name__)
 
@@ -10,6 +19,38 @@ def mcp_health():
     return jsonify(get_mcp_status())
 
 
+@mcp_bp.get("/mcp/ready")
+def mcp_ready():
+    readiness = get_mcp_readiness()
+    return jsonify(readiness), 200 if readiness["ready"] else 503
+
+
+@mcp_bp.get("/mcp/stats")
+def mcp_stats():
+    return jsonify(get_mcp_stats())
+
+
+@mcp_bp.get("/mcp/metrics")
+def mcp_metrics():
+    wants_text = request.args.get("format") == "prometheus" or (
+        "text/plain" in request.headers.get("Accept", "")
+        and "application/json" not in request.headers.get("Accept", "")
+    )
+    if wants_text:
+        return Response(get_mcp_metrics_prometheus(), mimetype="text/plain; version=0.0.4")
+    return jsonify(get_mcp_metrics())
+
+
+@mcp_bp.get("/mcp/tools")
+def mcp_tools():
+    server = request.args.get("server")
+    if not server:
+        return jsonify({"ok": False, "error": "missing_server"}), 400
+
+    refresh = request.args.get("refresh", "").lower() in ("1", "true", "yes")
+    return jsonify(list_mcp_tools(server, force=refresh))
+
+
 @mcp_bp.post("/mcp/call")
 def mcp_call():
     payload = request.get_json(silent=True) or {}
@@ -2,7 +2,8 @@ from flask import Blueprint, request, jsonify
 import bcrypt
 import re
 from datetime import datetime
-from ..services.database_service import DatabaseService
+from pymongo.errors import DuplicateKeyError
+from ..services.database_service import DatabaseService, duplicate_key_field
 
 register_bp = Blueprint("register", __name__)
 
@@ -87,7 +88,7 @@ def register():
             }), 400
         
         # Check if user already exists (by email or username)
-        existing_user = DatabaseService.find_one("users", {"email": email})
+        existing_user = DatabaseService.find_one("users", {"email": email}, projection="exists")
         if existing_user:
             return jsonify({
                 "success": False,
@@ -96,7 +97,7 @@ def register():
             
         # Check username uniqueness if provided
         if username and username != name:
-            existing_username = DatabaseService.find_one("users", {"username": username})
+            existing_username = DatabaseService.find_one("users", {"username": username}, projection="exists")
             if existing_username:
                 return jsonify({
                     "success": False,
@@ -122,8 +123,15 @@ def register():
         if username and username != name:
             user_data["username"] = username
         
-        # Insert user
-        user_id = DatabaseService.insert_one("users", user_data)
+        # Insert user; the unique indexes catch sign-ups racing past the checks above
+        try:
+            user_id = DatabaseService.insert_one("users", user_data)
+        except DuplicateKeyError as e:
+            taken = "Username is already taken" if duplicate_key_field(e) == "username" else "User with this email already exists"
+            return jsonify({
+                "success": False,
+                "error": taken
+            }), 409
         
         # Return success response (without password)
         response_data = {k: v for k, v in user_data.items() if k != "password"}
@@ -164,7 +172,7 @@ def check_email_availability():
             }), 400
         
         # Check if email exists
-        existing_user = DatabaseService.find_one("users", {"email": email})
+        existing_user = DatabaseService.find_one("users", {"email": email}, projection="exists")
         
         return jsonify({
             "success": True,
@@ -1,20 +1,80 @@
-from flask import Blueprint, request, jsonify
+import json
+import logging
+from datetime import datetime
+
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from bson import ObjectId
 from ..services.database_service import DatabaseService
 
 users_bp = Blueprint("users", __name__)
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
 
 
 @users_bp.route("/users", methods=["GET"])
 def get_users():
-    """Get all users"""
+    """Get a page of users; pass next_cursor back as ?cursor= for the next one"""
     try:
-        users = DatabaseService.find_many("users")
-        return jsonify({"success": True, "data": users}), 200
+        default_size = current_app.config.get("USERS_PAGE_SIZE", 50)
+        max_size = current_app.config.get("USERS_MAX_PAGE_SIZE", 200)
+        try:
+            limit = int(request.args.get("limit", default_size))
+        except ValueError:
+            return jsonify({"success": False, "error": "Invalid limit"}), 400
+        limit = max(1, min(limit, max_size))
+
+        cursor = request.args.get("cursor") or None
+        if cursor is not None and not ObjectId.is_valid(cursor):
+            return jsonify({"success": False, "error": "Invalid cursor"}), 400
+
+        # One extra document tells whether another page exists
+        users = DatabaseService.find_many(
+            "users",
+            limit=limit + 1,
+            projection="user_public",
+            sort=[("_id", 1)],
+            after=cursor,
+        )
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = users[-1]["_id"]
+        return jsonify({"success": True, "data": users, "next_cursor": next_cursor}), 200
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@users_bp.route("/users/export", methods=["GET"])
+def export_users():
+    """Stream every user as newline-delimited JSON"""
+    try:
+        DatabaseService.get_db()
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+    batch_size = current_app.config.get("EXPORT_BATCH_SIZE", 500)
+    users = DatabaseService.stream("users", projection="user_public", batch_size=batch_size)
+
+    def render():
+        try:
+            for user in users:
+                yield json.dumps(user, default=_json_default) + "\n"
+        except Exception as e:
+            # Headers are already sent; a cut-off body is all the client can see
+            logger.error(f"User export failed: {e}")
+
+    return Response(
+        stream_with_context(render()),
+        mimetype="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=users.ndjson", "X-Accel-Buffering": "no"},
+    )
+
+
 @users_bp.route("/users", methods=["POST"])
 def create_user():
     """Create a new user"""
@@ -29,7 +89,7 @@ def create_user():
             }), 400
         
         # Check if user already exists
-        existing_user = DatabaseService.find_one("users", {"email": data["email"]})
+        existing_user = DatabaseService.find_one("users", {"email": data["email"]}, projection="exists")
         if existing_user:
             return jsonify({
                 "success": False, 
@@ -55,7 +115,7 @@ def get_user(user_id):
         if not ObjectId.is_valid(user_id):
             return jsonify({"success": False, "error": "Invalid user ID"}), 400
             
-        user = DatabaseService.find_one("users", {"_id": ObjectId(user_id)})
+        user = DatabaseService.find_one("users", {"_id": ObjectId(user_id)}, projection="user_public")
         if not user:
             return jsonify({"success": False, "error": "User not found"}), 404
             
@@ -24,7 +24,35 @@ class Config:
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1")
     OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.2"))
     OPENAI_MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", "1200"))
+    OPENAI_MAX_TOKENS_CAP = int(os.getenv("OPENAI_MAX_TOKENS_CAP", "4096"))
+    OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+    OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
     MCP_GOOGLE_FORMS_STDIO_COMMAND = os.getenv("MCP_GOOGLE_FORMS_STDIO_COMMAND", "")
     MCP_GOOGLE_FORMS_STDIO_ARGS = os.getenv("MCP_GOOGLE_FORMS_STDIO_ARGS", "")
     MCP_GOOGLE_FORMS_STDIO_ENV = os.getenv("MCP_GOOGLE_FORMS_STDIO_ENV", "")
     MCP_GOOGLE_FORMS_STDIO_CWD = os.getenv("MCP_GOOGLE_FORMS_STDIO_CWD", "")
+    MCP_GOOGLE_FORMS_STDIO_POOL_SIZE = int(os.getenv("MCP_GOOGLE_FORMS_STDIO_POOL_SIZE", "1"))
+    MCP_GOOGLE_FORMS_STDIO_TRANSPORT = os.getenv("MCP_GOOGLE_FORMS_STDIO_TRANSPORT", "thread")
+    MCP_GOOGLE_FORMS_STDIO_MAX_IN_FLIGHT = int(os.getenv("MCP_GOOGLE_FORMS_STDIO_MAX_IN_FLIGHT", "64"))
+    MCP_TOOLS_CACHE_TTL = float(os.getenv("MCP_TOOLS_CACHE_TTL", "300"))
+    MCP_HEALTH_INTERVAL = float(os.getenv("MCP_HEALTH_INTERVAL", "30"))
+    MCP_WARMUP_ON_START = os.getenv("MCP_WARMUP_ON_START", "0") == "1"
+    FORM_QUESTION_CONCURRENCY = int(os.getenv("FORM_QUESTION_CONCURRENCY", "5"))
+    BLUEPRINT_CACHE_SIZE = int(os.getenv("BLUEPRINT_CACHE_SIZE", "256"))
+    BLUEPRINT_CACHE_TTL = float(os.getenv("BLUEPRINT_CACHE_TTL", "86400"))
+    BLUEPRINT_SIMILARITY_THRESHOLD = float(os.getenv("BLUEPRINT_SIMILARITY_THRESHOLD", "0.8"))
+    BLUEPRINT_SIMILARITY_INDEX_SIZE = int(os.getenv("BLUEPRINT_SIMILARITY_INDEX_SIZE", "5000"))
+    FORM_JOB_WORKERS = int(os.getenv("FORM_JOB_WORKERS", "4"))
+    FORM_JOB_QUEUE_SIZE = int(os.getenv("FORM_JOB_QUEUE_SIZE", "100"))
+    FORM_JOB_TTL = float(os.getenv("FORM_JOB_TTL", "604800"))
+    FORM_JOB_EVENTS_TIMEOUT = float(os.getenv("FORM_JOB_EVENTS_TIMEOUT", "60"))
+    FORM_BATCH_MAX_ITEMS = int(os.getenv("FORM_BATCH_MAX_ITEMS", "100"))
+    FORM_BATCH_LLM_CONCURRENCY = int(os.getenv("FORM_BATCH_LLM_CONCURRENCY", "4"))
+    FORM_BATCH_FORMS_CONCURRENCY = int(os.getenv("FORM_BATCH_FORMS_CONCURRENCY", "2"))
+    LLM_RATE_LIMIT_PER_MIN = float(os.getenv("LLM_RATE_LIMIT_PER_MIN", "60"))
+    FORMS_RATE_LIMIT_PER_MIN = float(os.getenv("FORMS_RATE_LIMIT_PER_MIN", "120"))
+    USERS_PAGE_SIZE = int(os.getenv("USERS_PAGE_SIZE", "50"))
+    USERS_MAX_PAGE_SIZE = int(os.getenv("USERS_MAX_PAGE_SIZE", "200"))
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+    USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
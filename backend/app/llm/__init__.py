@@ -0,0 +1,21 @@
+from typing import Any, Dict
+
+from .gateway import LlmGateway
+
+
+def build_gateway(config: Dict[str, Any], client: Any = None) -> LlmGateway:
+    return LlmGateway(
+        api_key=config.get("OPENAI_API_KEY") or "",
+        model=config.get("OPENAI_MODEL") or "",
+        temperature=config.get("OPENAI_TEMPERATURE", 0.2),
+        max_tokens=config.get("OPENAI_MAX_TOKENS", 1200),
+        timeout=config.get("OPENAI_TIMEOUT", 60.0),
+        max_retries=config.get("OPENAI_MAX_RETRIES", 2),
+        client=client,
+    )
+
+
+__all__ = [
+    "LlmGateway",
+    "build_gateway",
+]
@@ -0,0 +1,301 @@
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import openai
+from openai import OpenAI
+
+# Errors worth another attempt; anything else (bad request, auth) fails fast
+RETRYABLE_ERRORS = (
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+def _error_name(exc: Exception) -> str:
+    if isinstance(exc, openai.APITimeoutError):
+        return "llm_timeout"
+    if isinstance(exc, openai.RateLimitError):
+        return "llm_rate_limited"
+    if isinstance(exc, openai.APIConnectionError):
+        return "llm_connection_error"
+    if isinstance(exc, openai.APIStatusError):
+        return "llm_api_error"
+    return "llm_error"
+
+
+def _usage(response: Any) -> Dict[str, int]:
+    usage = getattr(response, "usage", None)
+    input_tokens = int(getattr(usage, "input_tokens", 0) or 0)
+    output_tokens = int(getattr(usage, "output_tokens", 0) or 0)
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+    }
+
+
+def _truncated(response: Any) -> bool:
+    if getattr(response, "status", None) != "incomplete":
+        return False
+    details = getattr(response, "incomplete_details", None)
+    return getattr(details, "reason", None) == "max_output_tokens"
+
+
+class LlmGateway:
+    """Owns the app's single OpenAI client and wraps every model call.
+
+    The SDK client keeps an HTTP connection pool, so it is built once and
+    shared by all requests. Pass ``client`` to use anything with a compatible
+    ``responses.create`` (e.g. a local stub in tests).
+    """
+
+    def __init__(
+        self,
+        api_key: str = "",
+        model: str = "",
+        temperature: float = 0.2,
+        max_tokens: int = 1200,
+        timeout: float = 60.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        max_retry_backoff: float = 8.0,
+        client: Any = None,
+        history: int = 100,
+    ) -> None:
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+        self.max_retries = max(0, int(max_retries))
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self._api_key = api_key
+        self._client = client
+        self._client_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=history)
+        self._requests = 0
+        self._errors = 0
+        self._retries = 0
+        self._input_tokens = 0
+        self._output_tokens = 0
+        self._latency_ms = 0.0
+        self._budgeted_tokens = 0
+        self._truncated = 0
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    # Retries are done here so they can be counted and jittered
+                    self._client = OpenAI(api_key=self._api_key, timeout=self.timeout, max_retries=0)
+        return self._client
+
+    def respond(
+        self,
+        input: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        label: str = "",
+    ) -> Dict[str, Any]:
+        request = self._request(input, model, temperature, max_tokens, timeout)
+        started = time.perf_counter()
+        response, attempts, error = self._create(request)
+        latency_ms = (time.perf_counter() - started) * 1000
+        if error is not None:
+            self._record(label, request, attempts, latency_ms, None, _error_name(error))
+            return self._failure(error, attempts, latency_ms)
+
+        usage = _usage(response)
+        truncated = _truncated(response)
+        self._record(label, request, attempts, latency_ms, usage, None, truncated)
+        return {
+            "ok": True,
+            "text": getattr(response, "output_text", "") or "",
+            "model": request["model"],
+            "usage": usage,
+            "max_output_tokens": request["max_output_tokens"],
+            "truncated": truncated,
+            "attempts": attempts,
+            "latency_ms": round(latency_ms, 2),
+        }
+
+    def stream(
+        self,
+        input: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        label: str = "",
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields ``delta`` events with output text, then one ``done`` or ``error``.
+
+        Only opening the stream is retried; once text has been yielded the
+        caller may already have acted on it.
+        """
+        request = self._request(input, model, temperature, max_tokens, timeout)
+        request["stream"] = True
+        started = time.perf_counter()
+        events, attempts, error = self._create(request)
+        if error is not None:
+            latency_ms = (time.perf_counter() - started) * 1000
+            self._record(label, request, attempts, latency_ms, None, _error_name(error))
+            yield dict(self._failure(error, attempts, latency_ms), type="error")
+            return
+
+        usage = None
+        truncated = False
+        first_token_ms = None
+        try:
+            for event in events:
+                kind = getattr(event, "type", "")
+                if kind == "response.output_text.delta":
+                    if first_token_ms is None:
+                        first_token_ms = round((time.perf_counter() - started) * 1000, 2)
+                    yield {"type": "delta", "text": event.delta}
+                elif kind == "response.completed":
+                    usage = _usage(event.response)
+                elif kind == "response.incomplete":
+                    # Hit the output budget; the caller decides what the partial text is worth
+                    usage = _usage(event.response)
+                    truncated = True
+                elif kind in ("response.failed", "error"):
+                    raise RuntimeError(f"stream ended with {kind}")
+        except Exception as exc:
+            latency_ms = (time.perf_counter() - started) * 1000
+            self._record(label, request, attempts, latency_ms, None, _error_name(exc))
+            yield dict(self._failure(exc, attempts, latency_ms), type="error")
+            return
+        finally:
+            if hasattr(events, "close"):
+                events.close()
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        usage = usage or _usage(None)
+        self._record(label, request, attempts, latency_ms, usage, None, truncated)
+        yield {
+            "type": "done",
+            "model": request["model"],
+            "usage": usage,
+            "max_output_tokens": request["max_output_tokens"],
+            "truncated": truncated,
+            "attempts": attempts,
+            "latency_ms": round(latency_ms, 2),
+            "first_token_ms": first_token_ms,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            succeeded = self._requests - self._errors
+            return {
+                "model": self.model,
+                "requests": self._requests,
+                "errors": self._errors,
+                "retries": self._retries,
+                "input_tokens": self._input_tokens,
+                "output_tokens": self._output_tokens,
+                "total_tokens": self._input_tokens + self._output_tokens,
+                "avg_latency_ms": round(self._latency_ms / succeeded, 2) if succeeded else 0.0,
+                "budgeted_output_tokens": self._budgeted_tokens,
+                "budget_utilization": (
+                    round(self._output_tokens / self._budgeted_tokens, 4) if self._budgeted_tokens else 0.0
+                ),
+                "truncated": self._truncated,
+                "recent": list(self._recent),
+            }
+
+    def close(self) -> None:
+        client = self._client
+        if client is not None and hasattr(client, "close"):
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _request(
+        self,
+        input: List[Dict[str, str]],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        timeout: Optional[float],
+    ) -> Dict[str, Any]:
+        return {
+            "model": model or self.model,
+            "input": input,
+            "temperature": self.temperature if temperature is None else temperature,
+            "max_output_tokens": max_tokens or self.max_tokens,
+            "timeout": timeout or self.timeout,
+        }
+
+    def _create(self, request: Dict[str, Any]) -> Tuple[Any, int, Optional[Exception]]:
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                return self.client.responses.create(**request), attempts, None
+            except Exception as exc:
+                if attempts > self.max_retries or not isinstance(exc, RETRYABLE_ERRORS):
+                    return None, attempts, exc
+                with self._lock:
+                    self._retries += 1
+                time.sleep(self._backoff(attempts))
+
+    @staticmethod
+    def _failure(error: Exception, attempts: int, latency_ms: float) -> Dict[str, Any]:
+        return {
+            "ok": False,
+            "error": _error_name(error),
+            "detail": str(error),
+            "attempts": attempts,
+            "latency_ms": round(latency_ms, 2),
+        }
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter keeps concurrent retries from landing on the API together
+        ceiling = min(self.max_retry_backoff, self.retry_backoff * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def _record(
+        self,
+        label: str,
+        request: Dict[str, Any],
+        attempts: int,
+        latency_ms: float,
+        usage: Optional[Dict[str, int]],
+        error: Optional[str],
+        truncated: bool = False,
+    ) -> None:
+        budget = int(request.get("max_output_tokens") or 0)
+        with self._lock:
+            self._requests += 1
+            if error:
+                self._errors += 1
+            else:
+                self._latency_ms += latency_ms
+                self._input_tokens += usage["input_tokens"]
+                self._output_tokens += usage["output_tokens"]
+                self._budgeted_tokens += budget
+                self._truncated += 1 if truncated else 0
+            self._recent.append({
+                "label": label,
+                "model": request["model"],
+                "ok": error is None,
+                "error": error,
+                "attempts": attempts,
+                "latency_ms": round(latency_ms, 2),
+                "usage": usage,
+                "max_output_tokens": budget,
+                "truncated": truncated,
+                "at": datetime.now(timezone.utc).isoformat(),
+            })
@@ -1,3 +1,17 @@
-from .registry import build_clients
+from .async_client import AsyncStdioMcpClient, SyncStdioMcpClient
+from .health import McpHealthMonitor
+from .pool import StdioMcpClientPool
+from .registry import build_clients, close_clients
+from .stdio_client import StdioMcpClient
+from .warmup import McpWarmup
 
-__all__ = ["build_clients"]
+__all__ = [
+    "AsyncStdioMcpClient",
+    "McpHealthMonitor",
+    "McpWarmup",
+    "StdioMcpClient",
+    "StdioMcpClientPool",
+    "SyncStdioMcpClient",
+    "build_clients",
+    "close_clients",
+]
@@ -0,0 +1,429 @@
+import asyncio
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import codec
+from .metrics import MCP_METRICS, McpMetrics, classify, operation_name
+
+# Tool results such as get_form_responses can be far larger than asyncio's 64 KiB line default
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class AsyncStdioMcpClient:
+    """MCP stdio client where every request id owns its own future.
+
+    A single reader task resolves the matching future for each response line,
+    so a response wakes exactly one waiter however many calls are in flight.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        command: str,
+        args: Optional[list] = None,
+        env: Optional[Dict[str, str]] = None,
+        cwd: Optional[str] = None,
+        timeout: float = 30.0,
+        max_in_flight: int = 64,
+        restart_backoff: float = 0.5,
+        max_restart_backoff: float = 30.0,
+        tools_ttl: float = 300.0,
+        server: Optional[str] = None,
+        metrics: Optional[McpMetrics] = None,
+    ) -> None:
+        self.name = name
+        self.server = server or name
+        self.metrics = metrics or MCP_METRICS
+        self.command = command
+        self.args = args or []
+        self.env = env or {}
+        self.cwd = cwd
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.tools_ttl = tools_ttl
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._start_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._initialized = False
+        self._timeouts = 0
+        self._late_responses = 0
+        self._rejected = 0
+        self._started_at = 0.0
+        self._next_start_at = 0.0
+        self._failures = 0
+        self._crashes = 0
+        self._restarts = 0
+        self._last_exit_code: Optional[int] = None
+        self._restart_handle: Optional[asyncio.TimerHandle] = None
+        self._generation = 0
+        self._tools_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._process and self._process.returncode is None)
+
+    @property
+    def available(self) -> bool:
+        return self.running or time.time() >= self._next_start_at
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def _ensure_process(self) -> Optional[str]:
+        # The reader clears _process on stdout EOF, so a set _process is still ours
+        if self._process is not None:
+            return None
+
+        async with self._start_lock:
+            if self._process is not None:
+                return None
+            if time.time() < self._next_start_at:
+                return "process_restarting"
+            self._initialized = False
+            try:
+                self._process = await asyncio.create_subprocess_exec(
+                    self.command,
+                    *self.args,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.cwd,
+                    env={**os.environ, **self.env},
+                    limit=STREAM_LIMIT,
+                )
+            except OSError:
+                self._next_start_at = time.time() + self._next_backoff()
+                return "process_start_failed"
+            self._generation += 1
+            self._started_at = time.time()
+            self._reader_task = asyncio.create_task(self._read_loop(self._process))
+            self._stderr_task = asyncio.create_task(self._read_stderr_loop(self._process))
+            return None
+
+    def _next_backoff(self) -> float:
+        if self._started_at and time.time() - self._started_at > self.max_restart_backoff:
+            self._failures = 0
+        delay = min(self.max_restart_backoff, self.restart_backoff * (2 ** self._failures))
+        self._failures += 1
+        return delay
+
+    async def _handle_exit(self, process: asyncio.subprocess.Process) -> None:
+        # Detach the dead process before anything awaits so new calls cannot queue on it
+        current = process is self._process
+        if current:
+            self._process = None
+            self._initialized = False
+            self._crashes += 1
+            delay = self._next_backoff()
+            self._next_start_at = time.time() + delay
+            self._restart_handle = asyncio.get_running_loop().call_later(
+                delay, lambda: asyncio.ensure_future(self._restart())
+            )
+
+        for request_id in list(self._pending):
+            future = self._pending.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_result({"ok": False, "error": "process_exited"})
+
+        if current:
+            self._last_exit_code = await process.wait()
+
+    async def _restart(self) -> None:
+        self._restart_handle = None
+        if self._process is not None:
+            return
+        if await self._ensure_process():
+            return
+        self._restarts += 1
+        await self._ensure_initialized()
+
+    async def _ensure_initialized(self) -> Dict[str, Any]:
+        if self._initialized:
+            return {"ok": True}
+
+        async with self._start_lock:
+            if self._initialized:
+                return {"ok": True}
+            response = await self._request(
+                "initialize",
+                {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {
+                        "name": "marketing-ai-backend",
+                        "version": "0.1.0",
+                    },
+                },
+            )
+            if response.get("ok") is False:
+                return response
+            await self._write({"jsonrpc": "2.0", "method": "notifications/initialized"})
+            self._initialized = True
+            return {"ok": True}
+
+    async def _read_loop(self, process: asyncio.subprocess.Process) -> None:
+        while True:
+            try:
+                line = await process.stdout.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                continue
+            if not line:
+                break
+            try:
+                payload = codec.loads(line)
+            except (codec.DecodeError, UnicodeDecodeError):
+                continue
+            if not isinstance(payload, dict):
+                continue
+            response_id = payload.get("id")
+            if not response_id:
+                continue
+            future = self._pending.pop(str(response_id), None)
+            if future is None:
+                self._late_responses += 1
+            elif not future.done():
+                future.set_result(payload)
+
+        await self._handle_exit(process)
+
+    async def _read_stderr_loop(self, process: asyncio.subprocess.Process) -> None:
+        while True:
+            line = await process.stderr.readline()
+            if not line:
+                break
+
+    async def _write(self, *payloads: Dict[str, Any]) -> None:
+        if not self._process or not self._process.stdin:
+            raise ConnectionError("process_not_running")
+        data = codec.encode_lines(payloads)
+        async with self._write_lock:
+            self._process.stdin.write(data)
+            await self._process.stdin.drain()
+
+    async def _wait(self, payload: Dict[str, Any], future: asyncio.Future, started: float) -> Dict[str, Any]:
+        response = await self._wait_for(payload["id"], payload["method"], future)
+        self.metrics.observe(
+            self.server,
+            operation_name(payload["method"], payload["params"]),
+            time.perf_counter() - started,
+            classify(response),
+        )
+        return response
+
+    async def _wait_for(self, request_id: str, method: str, future: asyncio.Future) -> Dict[str, Any]:
+        try:
+            return await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._pending.pop(request_id, None)
+
+        self._timeouts += 1
+        if method != "initialize":
+            try:
+                await self._write({
+                    "jsonrpc": "2.0",
+                    "method": "notifications/cancelled",
+                    "params": {"requestId": request_id, "reason": "timeout"},
+                })
+            except (ConnectionError, OSError):
+                pass
+        return {"ok": False, "error": "timeout"}
+
+    async def _request_many(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        if len(self._pending) + len(requests) > self.max_in_flight:
+            self._rejected += len(requests)
+            return [{"ok": False, "error": "too_many_in_flight"} for _ in requests]
+
+        loop = asyncio.get_running_loop()
+        payloads = []
+        futures = []
+        for method, params in requests:
+            request_id = str(uuid.uuid4())
+            future = loop.create_future()
+            self._pending[request_id] = future
+            futures.append(future)
+            payloads.append({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params or {},
+            })
+        started = time.perf_counter()
+        try:
+            await self._write(*payloads)
+        except (ConnectionError, OSError):
+            for payload in payloads:
+                self._pending.pop(payload["id"], None)
+            return [{"ok": False, "error": "process_not_running"} for _ in payloads]
+        return list(await asyncio.gather(*(
+            self._wait(payload, future, started) for payload, future in zip(payloads, futures)
+        )))
+
+    async def _request(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return (await self._request_many([(method, params)]))[0]
+
+    async def _send(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return (await self._send_batch([(method, params)]))[0]
+
+    async def _send_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        start_result = await self.start()
+        if start_result.get("ok") is False:
+            return [start_result for _ in requests]
+        return await self._request_many(requests)
+
+    async def start(self) -> Dict[str, Any]:
+        if not self.command:
+            return {"ok": False, "error": "missing_command"}
+
+        start_error = await self._ensure_process()
+        if start_error:
+            return {"ok": False, "error": start_error}
+        return await self._ensure_initialized()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "running": self.running,
+            "initialized": self._initialized,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "timeouts": self._timeouts,
+            "late_responses": self._late_responses,
+            "rejected": self._rejected,
+            "crashes": self._crashes,
+            "restarts": self._restarts,
+            "last_exit_code": self._last_exit_code,
+        }
+
+    async def close(self) -> None:
+        process = self._process
+        self._process = None
+        self._initialized = False
+        if self._restart_handle:
+            self._restart_handle.cancel()
+            self._restart_handle = None
+        if not process or process.returncode is not None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except (OSError, asyncio.TimeoutError):
+            process.kill()
+
+    async def ping(self) -> Dict[str, Any]:
+        return await self._send("ping", {})
+
+    async def list_tools(self, force: bool = False) -> Dict[str, Any]:
+        cached = self._tools_cache
+        if not force and cached and cached[0] == self._generation and time.time() < cached[1]:
+            return cached[2]
+        response = await self._send("tools/list", {})
+        if "result" in response:
+            self._tools_cache = (self._generation, time.time() + self.tools_ttl, response)
+        return response
+
+    async def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self._send(method, params)
+
+    async def tool_call(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self._send("tools/call", {"name": tool_name, "arguments": arguments or {}})
+
+    async def call_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        if not requests:
+            return []
+        return await self._send_batch(requests)
+
+    async def tool_call_many(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        return await self.call_batch([
+            ("tools/call", {"name": tool_name, "arguments": arguments or {}})
+            for tool_name, arguments in calls
+        ])
+
+
+class SyncStdioMcpClient:
+    """Blocking facade over AsyncStdioMcpClient for Flask request handlers.
+
+    The async client lives on a private event loop thread; every method
+    submits a coroutine to that loop and waits for its result.
+    """
+
+    def __init__(self, name: str, command: str, **kwargs) -> None:
+        self.name = name
+        self.command = command
+        self._client = AsyncStdioMcpClient(name=name, command=command, **kwargs)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name=f"mcp-{self.name}", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+        return self._loop
+
+    def _run(self, coro) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    @property
+    def running(self) -> bool:
+        return self._client.running
+
+    @property
+    def available(self) -> bool:
+        return self._client.available
+
+    @property
+    def in_flight(self) -> int:
+        return self._client.in_flight
+
+    def stats(self) -> Dict[str, Any]:
+        return self._client.stats()
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        self._run(self._client.close())
+        with self._loop_lock:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    def start(self) -> Dict[str, Any]:
+        return self._run(self._client.start())
+
+    def ping(self) -> Dict[str, Any]:
+        return self._run(self._client.ping())
+
+    def list_tools(self, force: bool = False) -> Dict[str, Any]:
+        return self._run(self._client.list_tools(force))
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._run(self._client.call(method, params))
+
+    def tool_call(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._run(self._client.tool_call(tool_name, arguments))
+
+    def call_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        return self._run(self._client.call_batch(requests))
+
+    def tool_call_many(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        return self._run(self._client.tool_call_many(calls))
@@ -0,0 +1,42 @@
+import json
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib codec is always available
+    orjson = None
+
+if orjson is not None:
+    CODEC_NAME = "orjson"
+    DecodeError = orjson.JSONDecodeError
+
+    def dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload)
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+else:
+    CODEC_NAME = "json"
+    DecodeError = json.JSONDecodeError
+
+    def dumps(payload: Any) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+def loads(data: bytes) -> Any:
+    try:
+        return _loads(data)
+    except (DecodeError, UnicodeDecodeError):
+        # Same leniency as the old text-mode pipes: invalid UTF-8 becomes U+FFFD
+        repaired = data.decode("utf-8", errors="replace").encode("utf-8")
+        if repaired == data:
+            raise
+        return _loads(repaired)
+
+
+def encode_lines(payloads: Iterable[Any]) -> bytes:
+    return b"".join(dumps(payload) + b"\n" for payload in payloads)
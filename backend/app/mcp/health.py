@@ -0,0 +1,104 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+
+def _exited(stats: Dict[str, Any]) -> bool:
+    # A process that ran and died, as opposed to one that was never started
+    return bool(stats.get("crashes")) or stats.get("last_exit_code") is not None
+
+
+class McpHealthMonitor:
+    """Pings every MCP client on a background thread and keeps the last result.
+
+    /api/mcp/health reads the snapshot instead of probing servers inline, so a
+    load balancer check never waits on a process spawn or a round trip.
+    The monitor never starts a process itself: servers that were never
+    started are reported ``idle`` and ones whose process exited ``down``.
+    """
+
+    def __init__(self, clients: Dict[str, Any], interval: float = 30.0) -> None:
+        self.clients = clients
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._status: Dict[str, Dict[str, Any]] = {
+            name: {"ok": None, "status": "unknown"} for name in clients
+        }
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self) -> None:
+        if self.running or self.interval <= 0 or not self.clients:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mcp-health", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.probe_all()
+            self._stop.wait(self.interval)
+
+    def probe_all(self) -> Dict[str, Dict[str, Any]]:
+        for name, client in self.clients.items():
+            self.probe(name, client)
+        return self.snapshot()
+
+    def probe(self, name: str, client: Any) -> Dict[str, Any]:
+        # Pools are probed worker by worker, since pinging the pool itself
+        # could be dispatched to a stopped worker and spawn it
+        targets = getattr(client, "workers", None) or [client]
+        stats = client.stats() if hasattr(client, "stats") else {}
+
+        healthy = 0
+        failed = 0
+        errors = []
+        latencies = []
+        for target in targets:
+            target_stats = target.stats() if hasattr(target, "stats") else {}
+            if "running" in target_stats and not target_stats["running"]:
+                if _exited(target_stats):
+                    failed += 1
+                    errors.append(f"process_exited ({target_stats.get('last_exit_code')})")
+                continue
+            started = time.perf_counter()
+            try:
+                response = target.ping()
+            except Exception as exc:
+                response = {"ok": False, "error": str(exc)}
+            latencies.append((time.perf_counter() - started) * 1000)
+            if "result" in response:
+                healthy += 1
+            else:
+                failed += 1
+                errors.append(response.get("error"))
+
+        if not healthy and not failed:
+            # Never started; starting it is up to warmup or the first call
+            status = {"ok": None, "status": "idle"}
+        else:
+            status = {"ok": failed == 0, "status": "up" if failed == 0 else ("degraded" if healthy else "down")}
+        if latencies:
+            status["latency_ms"] = round(max(latencies), 2)
+        status.update({
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "running": stats.get("running", healthy > 0),
+            "restarts": stats.get("restarts", 0),
+        })
+        if errors:
+            status["error"] = errors[0]
+        with self._lock:
+            self._status[name] = status
+        return status
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: dict(status) for name, status in self._status.items()}
@@ -0,0 +1,176 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds in seconds; Google Forms calls sit in the 100 ms - 5 s range
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+OUTCOMES = ("ok", "error", "timeout")
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += seconds
+        self.count += 1
+
+    def copy(self) -> "_Histogram":
+        clone = _Histogram()
+        clone.counts = list(self.counts)
+        clone.total = self.total
+        clone.count = self.count
+        return clone
+
+    def cumulative(self) -> List[int]:
+        running = 0
+        result = []
+        for value in self.counts:
+            running += value
+            result.append(running)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        # Upper bound of the bucket holding the q-th observation, like histogram_quantile without interpolation
+        if not self.count:
+            return None
+        rank = q * self.count
+        for index, total in enumerate(self.cumulative()):
+            if total >= rank:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else float("inf")
+        return float("inf")
+
+
+class McpMetrics:
+    """Per-server, per-tool latency histograms and outcome counters for MCP calls."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], _Histogram] = {}
+        self._outcomes: Dict[Tuple[str, str, str], int] = {}
+
+    def observe(self, server: str, tool: str, seconds: float, outcome: str) -> None:
+        with self._lock:
+            histogram = self._histograms.get((server, tool))
+            if histogram is None:
+                histogram = self._histograms[(server, tool)] = _Histogram()
+            histogram.observe(seconds)
+            key = (server, tool, outcome)
+            self._outcomes[key] = self._outcomes.get(key, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._outcomes.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        with self._lock:
+            histograms = {key: hist.copy() for key, hist in self._histograms.items()}
+            outcomes = dict(self._outcomes)
+
+        servers: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (server, tool), hist in histograms.items():
+            entry = {
+                "count": hist.count,
+                "sum_ms": round(hist.total * 1000, 3),
+                "avg_ms": round(hist.total * 1000 / hist.count, 3) if hist.count else None,
+                "p50_ms": _to_ms(hist.quantile(0.5)),
+                "p95_ms": _to_ms(hist.quantile(0.95)),
+                "p99_ms": _to_ms(hist.quantile(0.99)),
+                "buckets": {
+                    _bucket_label(index): value
+                    for index, value in enumerate(hist.cumulative())
+                },
+            }
+            for outcome in OUTCOMES:
+                entry[outcome] = outcomes.get((server, tool, outcome), 0)
+            servers.setdefault(server, {})[tool] = entry
+        return servers
+
+
+def classify(response: Dict[str, Any]) -> str:
+    if response.get("error") == "timeout":
+        return "timeout"
+    if "error" in response:
+        return "error"
+    result = response.get("result")
+    if isinstance(result, dict) and result.get("isError"):
+        return "error"
+    return "ok"
+
+
+def operation_name(method: str, params: Optional[Dict[str, Any]]) -> str:
+    if method == "tools/call" and params and params.get("name"):
+        return str(params["name"])
+    return method
+
+
+def render_prometheus(snapshot: Dict[str, Dict[str, Dict[str, Any]]], stats: Dict[str, Dict[str, Any]]) -> str:
+    lines = [
+        "# HELP mcp_request_duration_seconds Latency of MCP requests by server and tool.",
+        "# TYPE mcp_request_duration_seconds histogram",
+    ]
+    for server, tools in sorted(snapshot.items()):
+        for tool, entry in sorted(tools.items()):
+            labels = f'server="{_escape(server)}",tool="{_escape(tool)}"'
+            for index, value in enumerate(entry["buckets"].values()):
+                bound = "+Inf" if index == len(LATENCY_BUCKETS) else repr(LATENCY_BUCKETS[index])
+                lines.append(f'mcp_request_duration_seconds_bucket{{{labels},le="{bound}"}} {value}')
+            lines.append(f"mcp_request_duration_seconds_sum{{{labels}}} {entry['sum_ms'] / 1000}")
+            lines.append(f"mcp_request_duration_seconds_count{{{labels}}} {entry['count']}")
+
+    lines += [
+        "# HELP mcp_requests_total MCP requests by server, tool and outcome.",
+        "# TYPE mcp_requests_total counter",
+    ]
+    for server, tools in sorted(snapshot.items()):
+        for tool, entry in sorted(tools.items()):
+            for outcome in OUTCOMES:
+                lines.append(
+                    f'mcp_requests_total{{server="{_escape(server)}",tool="{_escape(tool)}",'
+                    f'outcome="{outcome}"}} {entry[outcome]}'
+                )
+
+    gauges = (
+        ("mcp_in_flight_requests", "gauge", "Requests currently waiting on an MCP server.", "in_flight"),
+        ("mcp_rejected_requests_total", "counter", "Requests refused by the in-flight cap.", "rejected"),
+        ("mcp_late_responses_total", "counter", "Responses that arrived after their caller timed out.", "late_responses"),
+        ("mcp_process_crashes_total", "counter", "MCP server processes that exited unexpectedly.", "crashes"),
+        ("mcp_process_restarts_total", "counter", "MCP server processes restarted by the supervisor.", "restarts"),
+    )
+    for metric, kind, help_text, field in gauges:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for server, values in sorted(stats.items()):
+            lines.append(f'{metric}{{server="{_escape(server)}"}} {values.get(field, 0)}')
+    return "\n".join(lines) + "\n"
+
+
+def _to_ms(value: Optional[float]) -> Optional[float]:
+    # Observations past the last bucket have no upper bound to report
+    if value is None or value == float("inf"):
+        return None
+    return round(value * 1000, 3)
+
+
+def _bucket_label(index: int) -> str:
+    if index == len(LATENCY_BUCKETS):
+        return "+Inf"
+    return f"{LATENCY_BUCKETS[index] * 1000:g}ms"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+MCP_METRICS = McpMetrics()
@@ -0,0 +1,178 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import McpMetrics
+from .stdio_client import StdioMcpClient
+
+
+class StdioMcpClientPool:
+    """Spreads calls for one MCP server across several child processes.
+
+    Each call goes to the worker with the fewest outstanding requests, so a
+    slow Google API call only holds up one process instead of the whole server.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        command: str,
+        size: int = 2,
+        args: Optional[list] = None,
+        env: Optional[Dict[str, str]] = None,
+        cwd: Optional[str] = None,
+        timeout: float = 30.0,
+        max_in_flight: int = 64,
+        tools_ttl: float = 300.0,
+        metrics: Optional[McpMetrics] = None,
+        client_class: type = StdioMcpClient,
+    ) -> None:
+        self.name = name
+        self.command = command
+        self.size = max(1, size)
+        self.workers: List[StdioMcpClient] = [
+            client_class(
+                name=f"{name}#{index}",
+                command=command,
+                args=args,
+                env=env,
+                cwd=cwd,
+                timeout=timeout,
+                max_in_flight=max_in_flight,
+                tools_ttl=tools_ttl,
+                server=name,
+                metrics=metrics,
+            )
+            for index in range(self.size)
+        ]
+        self._lock = threading.Lock()
+        self._outstanding = [0] * self.size
+        self._dispatched = [0] * self.size
+        self._next = 0
+
+    def _acquire(self, weight: int = 1) -> int:
+        with self._lock:
+            # Workers waiting out a restart backoff go last; ties rotate so idle
+            # workers share the load instead of always hitting #0
+            start = self._next
+            index = min(
+                range(self.size),
+                key=lambda i: (
+                    not self.workers[i].available,
+                    self._outstanding[i],
+                    (i - start) % self.size,
+                ),
+            )
+            self._next = (index + 1) % self.size
+            self._outstanding[index] += weight
+            self._dispatched[index] += weight
+            return index
+
+    def _release(self, index: int, weight: int = 1) -> None:
+        with self._lock:
+            self._outstanding[index] -= weight
+
+    def _dispatch(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if not self.command:
+            return {"ok": False, "error": "missing_command"}
+
+        index = self._acquire()
+        try:
+            return self.workers[index].call(method, params)
+        finally:
+            self._release(index)
+
+    def _dispatch_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        if not self.command:
+            return [{"ok": False, "error": "missing_command"} for _ in requests]
+
+        index = self._acquire(len(requests))
+        try:
+            return self.workers[index].call_batch(requests)
+        finally:
+            self._release(index, len(requests))
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return sum(self._outstanding)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            outstanding = list(self._outstanding)
+            dispatched = list(self._dispatched)
+        workers = []
+        for index, worker in enumerate(self.workers):
+            workers.append({
+                **worker.stats(),
+                "outstanding": outstanding[index],
+                "dispatched": dispatched[index],
+            })
+        return {
+            "name": self.name,
+            "size": self.size,
+            "running": sum(1 for worker in self.workers if worker.running),
+            "restarts": sum(worker.get("restarts", 0) for worker in workers),
+            "crashes": sum(worker.get("crashes", 0) for worker in workers),
+            "timeouts": sum(worker.get("timeouts", 0) for worker in workers),
+            "late_responses": sum(worker.get("late_responses", 0) for worker in workers),
+            "rejected": sum(worker.get("rejected", 0) for worker in workers),
+            "in_flight": sum(outstanding),
+            "workers": workers,
+        }
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.close()
+
+    def start(self) -> Dict[str, Any]:
+        if not self.command:
+            return {"ok": False, "error": "missing_command"}
+
+        results: List[Dict[str, Any]] = [{} for _ in self.workers]
+
+        def _start(index: int) -> None:
+            results[index] = self.workers[index].start()
+
+        threads = [
+            threading.Thread(target=_start, args=(index,), daemon=True)
+            for index in range(self.size)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        failed = [result for result in results if result.get("ok") is False]
+        if failed:
+            return {"ok": False, "error": failed[0].get("error"), "started": self.size - len(failed)}
+        return {"ok": True, "started": self.size}
+
+    def ping(self) -> Dict[str, Any]:
+        return self._dispatch("ping", {})
+
+    def list_tools(self, force: bool = False) -> Dict[str, Any]:
+        if not self.command:
+            return {"ok": False, "error": "missing_command"}
+
+        index = self._acquire()
+        try:
+            return self.workers[index].list_tools(force)
+        finally:
+            self._release(index)
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._dispatch(method, params)
+
+    def tool_call(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._dispatch("tools/call", {"name": tool_name, "arguments": arguments or {}})
+
+    def call_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        if not requests:
+            return []
+        return self._dispatch_batch(requests)
+
+    def tool_call_many(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        return self.call_batch([
+            ("tools/call", {"name": tool_name, "arguments": arguments or {}})
+            for tool_name, arguments in calls
+        ])
@@ -1,16 +1,25 @@
 import json
 import os
-from typing import Dict, List
+from typing import Dict, List, Union
 
+from .async_client import SyncStdioMcpClient
+from .pool import StdioMcpClientPool
 from .stdio_client import StdioMcpClient
 
+McpClient = Union[StdioMcpClient, SyncStdioMcpClient, StdioMcpClientPool]
 
-def build_clients(config) -> Dict[str, StdioMcpClient]:
+TRANSPORTS = {
+    "thread": StdioMcpClient,
+    "asyncio": SyncStdioMcpClient,
+}
+
+
+def build_clients(config) -> Dict[str, McpClient]:
     clients = {}
 
     if config.get("MCP_GOOGLE_FORMS_STDIO_COMMAND"):
         project_root = _project_root()
-        clients["google_forms"] = StdioMcpClient(
+        options = dict(
             name="google_forms",
             command=config.get("MCP_GOOGLE_FORMS_STDIO_COMMAND", ""),
             args=_resolve_args(
@@ -19,11 +28,32 @@ def build_clients(config) -> Dict[str, StdioMcpClient]:
             ),
             env=_parse_json_dict(config.get("MCP_GOOGLE_FORMS_STDIO_ENV", "")),
             cwd=_resolve_path(config.get("MCP_GOOGLE_FORMS_STDIO_CWD", None), project_root),
+            max_in_flight=_parse_int(config.get("MCP_GOOGLE_FORMS_STDIO_MAX_IN_FLIGHT", 64), 64),
+            tools_ttl=_parse_float(config.get("MCP_TOOLS_CACHE_TTL", 300), 300.0),
+        )
+        client_class = TRANSPORTS.get(
+            (config.get("MCP_GOOGLE_FORMS_STDIO_TRANSPORT") or "thread").lower(),
+            StdioMcpClient,
         )
+        pool_size = _parse_int(config.get("MCP_GOOGLE_FORMS_STDIO_POOL_SIZE", 1), 1)
+        if pool_size > 1:
+            clients["google_forms"] = StdioMcpClientPool(
+                size=pool_size, client_class=client_class, **options
+            )
+        else:
+            clients["google_forms"] = client_class(**options)
 
     return clients
 
 
+def close_clients(clients: Dict[str, McpClient]) -> None:
+    for client in clients.values():
+        try:
+            client.close()
+        except Exception:
+            continue
+
+
 def _parse_json_list(value: str) -> list:
     if not value:
         return []
@@ -44,6 +74,20 @@ def _parse_json_dict(value: str) -> dict:
         return {}
 
 
+def _parse_int(value, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_float(value, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def _project_root() -> str:
     return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 
@@ -1,9 +1,30 @@
-import json
 import subprocess
 import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from . import codec
+from .metrics import MCP_METRICS, McpMetrics, classify, operation_name
+
+# Large reads keep readline() from stitching big tool results together 8 KiB at a time
+PIPE_BUFFER_SIZE = 64 * 1024
+
+
+class _PendingRequest:
+    __slots__ = (
+        "method", "operation", "deadline", "generation", "started", "finished", "event", "response",
+    )
+
+    def __init__(self, method: str, operation: str, deadline: float, generation: int) -> None:
+        self.method = method
+        self.operation = operation
+        self.deadline = deadline
+        self.generation = generation
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.event = threading.Event()
+        self.response: Optional[Dict[str, Any]] = None
 
 
 class StdioMcpClient:
@@ -15,107 +36,278 @@ class StdioMcpClient:
         env: Optional[Dict[str, str]] = None,
         cwd: Optional[str] = None,
         timeout: float = 30.0,
+        max_in_flight: int = 64,
+        restart_backoff: float = 0.5,
+        max_restart_backoff: float = 30.0,
+        tools_ttl: float = 300.0,
+        server: Optional[str] = None,
+        metrics: Optional[McpMetrics] = None,
     ) -> None:
         self.name = name
+        self.server = server or name
+        self.metrics = metrics or MCP_METRICS
         self.command = command
         self.args = args or []
         self.env = env or {}
         self.cwd = cwd
         self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.tools_ttl = tools_ttl
         self._process = None
         self._lock = threading.Lock()
-        self._cond = threading.Condition()
-        self._responses: Dict[str, Dict[str, Any]] = {}
+        self._start_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[str, _PendingRequest] = {}
         self._reader = None
         self._initialized = False
+        self._timeouts = 0
+        self._late_responses = 0
+        self._rejected = 0
+        self._started_at = 0.0
+        self._next_start_at = 0.0
+        self._failures = 0
+        self._crashes = 0
+        self._restarts = 0
+        self._last_exit_code: Optional[int] = None
+        self._restart_timer: Optional[threading.Timer] = None
+        self._generation = 0
+        self._exited_generation = 0
+        self._tools_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
 
-    def _ensure_process(self) -> None:
+    def _ensure_process(self) -> Optional[str]:
         if self._process and self._process.poll() is None:
-            return
+            return None
 
-        self._process = subprocess.Popen(
-            [self.command, *self.args],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            cwd=self.cwd,
-            env={**subprocess.os.environ, **self.env},
+        with self._start_lock:
+            if self._process and self._process.poll() is None:
+                return None
+            if time.time() < self._next_start_at:
+                return "process_restarting"
+            if not self._spawn():
+                return "process_start_failed"
+            return None
+
+    def _spawn(self) -> bool:
+        self._initialized = False
+        try:
+            process = subprocess.Popen(
+                [self.command, *self.args],
+                bufsize=PIPE_BUFFER_SIZE,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self.cwd,
+                env={**subprocess.os.environ, **self.env},
+            )
+        except OSError:
+            self._next_start_at = time.time() + self._next_backoff()
+            return False
+
+        self._process = process
+        self._generation += 1
+        self._started_at = time.time()
+        self._reader = threading.Thread(
+            target=self._read_loop, args=(self._process, self._generation), daemon=True
         )
-        self._reader = threading.Thread(target=self._read_loop, daemon=True)
         self._reader.start()
-        self._stderr_reader = threading.Thread(target=self._read_stderr_loop, daemon=True)
+        self._stderr_reader = threading.Thread(
+            target=self._read_stderr_loop, args=(self._process,), daemon=True
+        )
         self._stderr_reader.start()
+        return True
 
-    def _read_loop(self) -> None:
+    def _read_loop(self, process: subprocess.Popen, generation: int) -> None:
         while True:
-            if not self._process or not self._process.stdout:
+            if not process.stdout:
                 break
-            line = self._process.stdout.readline()
+            line = process.stdout.readline()
             if not line:
                 break
             try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
+                payload = codec.loads(line)
+            except (codec.DecodeError, UnicodeDecodeError):
+                continue
+            if not isinstance(payload, dict):
                 continue
             response_id = payload.get("id")
             if not response_id:
                 continue
-            with self._cond:
-                self._responses[str(response_id)] = payload
-                self._cond.notify_all()
+            with self._pending_lock:
+                pending = self._pending.pop(str(response_id), None)
+                if pending is None:
+                    # Answer to a request we already gave up on; drop it
+                    self._late_responses += 1
+                    continue
+                pending.response = payload
+                pending.finished = time.perf_counter()
+            pending.event.set()
+
+        self._handle_exit(process, generation)
 
-    def _read_stderr_loop(self) -> None:
+    def _handle_exit(self, process: subprocess.Popen, generation: int) -> None:
+        # stdout EOF means the server is gone: fail waiters now instead of at their deadline
+        with self._pending_lock:
+            self._exited_generation = generation
+            orphaned = [
+                request_id for request_id, entry in self._pending.items()
+                if entry.generation == generation
+            ]
+            pending = [self._pending.pop(request_id) for request_id in orphaned]
+        for entry in pending:
+            entry.response = {"ok": False, "error": "process_exited"}
+            entry.finished = time.perf_counter()
+            entry.event.set()
+
+        with self._start_lock:
+            if process is not self._process:
+                return
+            try:
+                self._last_exit_code = process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+            self._process = None
+            self._initialized = False
+            self._crashes += 1
+            self._schedule_restart()
+
+    def _next_backoff(self) -> float:
+        if self._started_at and time.time() - self._started_at > self.max_restart_backoff:
+            # The previous process stayed up for a while, so start the backoff over
+            self._failures = 0
+        delay = min(self.max_restart_backoff, self.restart_backoff * (2 ** self._failures))
+        self._failures += 1
+        return delay
+
+    def _schedule_restart(self) -> None:
+        delay = self._next_backoff()
+        self._next_start_at = time.time() + delay
+        if self._restart_timer:
+            self._restart_timer.cancel()
+        self._restart_timer = threading.Timer(delay, self._restart)
+        self._restart_timer.daemon = True
+        self._restart_timer.start()
+
+    def _restart(self) -> None:
+        with self._start_lock:
+            self._restart_timer = None
+            if self._process and self._process.poll() is None:
+                return
+            if not self._spawn():
+                return
+            self._restarts += 1
+        self._ensure_initialized()
+
+    def _read_stderr_loop(self, process: subprocess.Popen) -> None:
         while True:
-            if not self._process or not self._process.stderr:
+            if not process.stderr:
                 break
-            line = self._process.stderr.readline()
+            line = process.stderr.readline()
             if not line:
                 break
             continue
 
     def _send(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        if not self.command:
-            return {"ok": False, "error": "missing_command"}
+        return self._send_batch([(method, params)])[0]
+
+    def _send_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        start_result = self.start()
+        if start_result.get("ok") is False:
+            return [start_result for _ in requests]
 
-        self._ensure_process()
-        if not self._initialized and method != "initialize":
-            init_result = self._initialize()
-            if init_result.get("ok") is False:
-                return init_result
-        request_id = str(uuid.uuid4())
-        payload = {
+        return self._request_many(requests)
+
+    def _request_many(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        payloads = [self._request_payload(method, params) for method, params in requests]
+        pending = self._register(payloads)
+        if isinstance(pending, str):
+            return [{"ok": False, "error": pending} for _ in requests]
+        if not self._write(payloads):
+            with self._pending_lock:
+                for payload in payloads:
+                    self._pending.pop(payload["id"], None)
+            return [{"ok": False, "error": "process_not_running"} for _ in requests]
+        results = []
+        for payload, entry in zip(payloads, pending):
+            response = self._wait_for(payload["id"], entry)
+            finished = entry.finished or time.perf_counter()
+            self.metrics.observe(self.server, entry.operation, finished - entry.started, classify(response))
+            results.append(response)
+        return results
+
+    def _request_payload(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
             "jsonrpc": "2.0",
-            "id": request_id,
+            "id": str(uuid.uuid4()),
             "method": method,
             "params": params or {},
         }
 
-        if not self._process or not self._process.stdin:
-            return {"ok": False, "error": "process_not_running"}
+    def _register(self, payloads: List[Dict[str, Any]]) -> Union[List[_PendingRequest], str]:
+        deadline = time.time() + self.timeout
+        with self._pending_lock:
+            if self._exited_generation == self._generation:
+                return "process_exited"
+            if len(self._pending) + len(payloads) > self.max_in_flight:
+                self._rejected += len(payloads)
+                return "too_many_in_flight"
+            entries = []
+            for payload in payloads:
+                entry = _PendingRequest(
+                    payload["method"],
+                    operation_name(payload["method"], payload["params"]),
+                    deadline,
+                    self._generation,
+                )
+                self._pending[payload["id"]] = entry
+                entries.append(entry)
+            return entries
 
-        with self._lock:
-            self._process.stdin.write(json.dumps(payload) + "\n")
-            self._process.stdin.flush()
+    def _write(self, payloads: List[Dict[str, Any]]) -> bool:
+        # All lines go out in one write/flush so a batch costs a single pipe round trip
+        data = codec.encode_lines(payloads)
+        process = self._process
+        if not process or not process.stdin:
+            return False
+        try:
+            with self._lock:
+                process.stdin.write(data)
+                process.stdin.flush()
+        except (OSError, ValueError):
+            return False
+        return True
 
-        deadline = time.time() + self.timeout
-        with self._cond:
-            while request_id not in self._responses:
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    return {"ok": False, "error": "timeout"}
-                self._cond.wait(timeout=remaining)
-            return self._responses.pop(request_id)
+    def _wait_for(self, request_id: str, pending: _PendingRequest) -> Dict[str, Any]:
+        remaining = pending.deadline - time.time()
+        if remaining > 0:
+            pending.event.wait(timeout=remaining)
+
+        with self._pending_lock:
+            expired = self._pending.pop(request_id, None) is not None
+            if expired:
+                self._timeouts += 1
+        if not expired:
+            return pending.response
+
+        if pending.method != "initialize":
+            self._write([{
+                "jsonrpc": "2.0",
+                "method": "notifications/cancelled",
+                "params": {"requestId": request_id, "reason": "timeout"},
+            }])
+        return {"ok": False, "error": "timeout"}
+
+    def _ensure_initialized(self) -> Dict[str, Any]:
+        with self._start_lock:
+            if self._initialized:
+                return {"ok": True}
+            return self._initialize()
 
     def _initialize(self) -> Dict[str, Any]:
-        request_id = str(uuid.uuid4())
-        payload = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": "initialize",
-            "params": {
+        response = self._request_many([(
+            "initialize",
+            {
                 "protocolVersion": "2024-11-05",
                 "capabilities": {},
                 "clientInfo": {
@@ -123,37 +315,98 @@ class StdioMcpClient:
                     "version": "0.1.0",
                 },
             },
-        }
+        )])[0]
+        if response.get("ok") is False:
+            return response
 
-        if not self._process or not self._process.stdin:
+        if not self._write([{"jsonrpc": "2.0", "method": "notifications/initialized"}]):
             return {"ok": False, "error": "process_not_running"}
 
-        with self._lock:
-            self._process.stdin.write(json.dumps(payload) + "\n")
-            self._process.stdin.flush()
+        self._initialized = True
+        return {"ok": True}
 
-        deadline = time.time() + self.timeout
-        with self._cond:
-            while request_id not in self._responses:
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    return {"ok": False, "error": "timeout"}
-                self._cond.wait(timeout=remaining)
-            self._responses.pop(request_id, None)
-
-        notification = {"jsonrpc": "2.0", "method": "notifications/initialized"}
-        with self._lock:
-            self._process.stdin.write(json.dumps(notification) + "\n")
-            self._process.stdin.flush()
+    def close(self) -> None:
+        with self._start_lock:
+            process = self._process
+            self._process = None
+            self._initialized = False
+            if self._restart_timer:
+                self._restart_timer.cancel()
+                self._restart_timer = None
+        if not process or process.poll() is not None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.terminate()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
 
-        self._initialized = True
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._process and self._process.poll() is None)
+
+    @property
+    def available(self) -> bool:
+        return self.running or time.time() >= self._next_start_at
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "running": self.running,
+            "initialized": self._initialized,
+            "in_flight": len(self._pending),
+            "max_in_flight": self.max_in_flight,
+            "timeouts": self._timeouts,
+            "late_responses": self._late_responses,
+            "rejected": self._rejected,
+            "crashes": self._crashes,
+            "restarts": self._restarts,
+            "last_exit_code": self._last_exit_code,
+        }
+
+    def start(self) -> Dict[str, Any]:
+        if not self.command:
+            return {"ok": False, "error": "missing_command"}
+
+        start_error = self._ensure_process()
+        if start_error:
+            return {"ok": False, "error": start_error}
+        if not self._initialized:
+            return self._ensure_initialized()
         return {"ok": True}
 
     def ping(self) -> Dict[str, Any]:
-        return self._send("tools/list", {})
+        return self._send("ping", {})
+
+    def list_tools(self, force: bool = False) -> Dict[str, Any]:
+        # Schemas only change when the server process does, so the cache is keyed on its generation
+        cached = self._tools_cache
+        if not force and cached and cached[0] == self._generation and time.time() < cached[1]:
+            return cached[2]
+        response = self._send("tools/list", {})
+        if "result" in response:
+            self._tools_cache = (self._generation, time.time() + self.tools_ttl, response)
+        return response
 
     def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         return self._send(method, params)
 
     def tool_call(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         return self._send("tools/call", {"name": tool_name, "arguments": arguments or {}})
+
+    def call_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        if not requests:
+            return []
+        return self._send_batch(requests)
+
+    def tool_call_many(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        return self.call_batch([
+            ("tools/call", {"name": tool_name, "arguments": arguments or {}})
+            for tool_name, arguments in calls
+        ])
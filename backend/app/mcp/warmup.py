@@ -0,0 +1,80 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class McpWarmup:
+    """Starts and initializes every MCP client in the background at boot.
+
+    Until every client has finished its handshake, ``ready`` stays False so
+    /api/mcp/ready can keep orchestrators from routing traffic to a cold instance.
+    """
+
+    def __init__(self, clients: Dict[str, Any], enabled: bool = True) -> None:
+        self.clients = clients
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if not enabled or not clients:
+            self._done.set()
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def ready(self) -> bool:
+        if not self.enabled:
+            return True
+        return self.finished and all(result.get("ok") for result in self.snapshot().values())
+
+    def start(self) -> None:
+        if self.finished or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="mcp-warmup", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        threads = [
+            threading.Thread(target=self._warm, args=(name, client), daemon=True)
+            for name, client in self.clients.items()
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        healthy = all(result.get("ok") for result in self.snapshot().values())
+        status = "ready" if healthy else "not ready"
+        print(f"🔥 MCP warm-up finished in {elapsed_ms:.0f} ms ({status})")
+        self._done.set()
+
+    def _warm(self, name: str, client: Any) -> None:
+        started = time.perf_counter()
+        try:
+            result = client.start()
+        except Exception as exc:
+            result = {"ok": False, "error": str(exc)}
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        entry = {"ok": result.get("ok") is not False, "cold_start_ms": elapsed_ms}
+        if not entry["ok"]:
+            entry["error"] = result.get("error")
+            print(f"❌ MCP server {name} failed to warm up after {elapsed_ms:.0f} ms: {entry['error']}")
+        else:
+            print(f"✅ MCP server {name} warm in {elapsed_ms:.0f} ms")
+        with self._lock:
+            self._results[name] = entry
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            results = {name: dict(result) for name, result in self._results.items()}
+        for name in self.clients:
+            results.setdefault(name, {"ok": None, "status": "pending"})
+        return results
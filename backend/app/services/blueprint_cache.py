@@ -0,0 +1,191 @@
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "blueprint_cache"
+
+
+def _normalize(value: Any) -> str:
+    return " ".join(str(value or "").split()).lower()
+
+
+def blueprint_cache_key(
+    topic: str,
+    audience: str,
+    language: str,
+    num_questions: int,
+    model: str,
+    temperature: float,
+) -> str:
+    material = json.dumps(
+        {
+            "topic": _normalize(topic),
+            "audience": _normalize(audience),
+            "language": _normalize(language),
+            "num_questions": int(num_questions),
+            "model": model,
+            "temperature": float(temperature),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class BlueprintCache:
+    """In-process LRU in front of a Mongo collection with a TTL index."""
+
+    def __init__(self, db=None, size: int = 256, ttl: float = 86400.0):
+        self.db = db
+        self.size = max(0, int(size))
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._memory_hits = 0
+        self._mongo_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def ensure_indexes(self) -> None:
+        if self.db is None or not self.enabled:
+            return
+        try:
+            self.db[COLLECTION].create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.warning(f"Could not create blueprint cache index: {e}")
+
+    def get(self, key: str, count: bool = True) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached blueprint; ``count=False`` leaves the hit/miss counters alone."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._memory_hits += 1 if count else 0
+                    return copy.deepcopy(entry[1])
+                del self._entries[key]
+
+        loaded = self._load(key)
+        with self._lock:
+            if loaded is None:
+                self._misses += 1 if count else 0
+                return None
+            self._mongo_hits += 1 if count else 0
+        blueprint, expires_at = loaded
+        self._remember(key, blueprint, expires_at)
+        return copy.deepcopy(blueprint)
+
+    def set(self, key: str, blueprint: Dict[str, Any], inputs: Optional[Dict[str, Any]] = None) -> None:
+        if not self.enabled:
+            return
+        self._remember(key, copy.deepcopy(blueprint), time.time() + self.ttl)
+        with self._lock:
+            self._stores += 1
+
+        if self.db is None:
+            return
+        try:
+            self.db[COLLECTION].replace_one(
+                {"_id": key},
+                {
+                    "_id": key,
+                    "blueprint": blueprint,
+                    "inputs": inputs or {},
+                    "created_at": datetime.now(timezone.utc),
+                    "expires_at": datetime.now(timezone.utc) + timedelta(seconds=self.ttl),
+                },
+                upsert=True,
+            )
+        except Exception as e:
+            with self._lock:
+                self._errors += 1
+            logger.warning(f"Error storing blueprint cache entry: {e}")
+
+    def recent(self, limit: int) -> List[Tuple[str, Dict[str, Any], int]]:
+        """Keys, inputs and question counts of the newest unexpired Mongo entries, oldest first."""
+        if self.db is None or not self.enabled or limit <= 0:
+            return []
+        try:
+            cursor = self.db[COLLECTION].aggregate([
+                {"$match": {"expires_at": {"$gt": datetime.now(timezone.utc)}}},
+                {"$sort": {"created_at": -1}},
+                {"$limit": int(limit)},
+                {"$project": {"inputs": 1, "questions": {"$size": {"$ifNull": ["$blueprint.questions", []]}}}},
+            ])
+            entries = [
+                (document["_id"], document.get("inputs") or {}, int(document.get("questions") or 0))
+                for document in cursor
+            ]
+        except Exception as e:
+            logger.warning(f"Error listing blueprint cache entries: {e}")
+            return []
+        entries.reverse()
+        return entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self._memory_hits + self._mongo_hits
+            lookups = hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.size,
+                "ttl": self.ttl,
+                "hits": hits,
+                "memory_hits": self._memory_hits,
+                "mongo_hits": self._mongo_hits,
+                "misses": self._misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "stores": self._stores,
+                "errors": self._errors,
+            }
+
+    def _remember(self, key: str, blueprint: Dict[str, Any], expires_at: float) -> None:
+        if self.size == 0:
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, blueprint)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        if self.db is None:
+            return None
+        try:
+            # The TTL monitor only sweeps once a minute, so filter on expiry too
+            document = self.db[COLLECTION].find_one(
+                {"_id": key, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+                {"blueprint": 1, "expires_at": 1},
+            )
+        except Exception as e:
+            with self._lock:
+                self._errors += 1
+            logger.warning(f"Error reading blueprint cache entry: {e}")
+            return None
+        if not document or not isinstance(document.get("blueprint"), dict):
+            return None
+        expires_at = document["expires_at"]
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return document["blueprint"], expires_at.timestamp()
@@ -0,0 +1,269 @@
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .blueprint_stream import BlueprintStreamParser
+
+MIN_OPTIONS = 3
+MAX_OPTIONS = 6
+
+QUESTION_TYPES = {
+    "text": "text",
+    "short_answer": "text",
+    "short_text": "text",
+    "paragraph": "text",
+    "open": "text",
+    "open_ended": "text",
+    "multiple_choice": "multiple_choice",
+    "multiplechoice": "multiple_choice",
+    "choice": "multiple_choice",
+    "radio": "multiple_choice",
+    "single_choice": "multiple_choice",
+    "mcq": "multiple_choice",
+}
+
+# Declarative shape of a blueprint; compiled once into validator functions
+BLUEPRINT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string", "default": "Survey"},
+        "description": {"type": "string", "default": ""},
+        "questions": {
+            "type": "array",
+            "min_items": 1,
+            "items": {
+                "type": "object",
+                "required": ["title"],
+                "properties": {
+                    "type": {"type": "enum", "values": QUESTION_TYPES, "default": "text"},
+                    "title": {"type": "string"},
+                    "required": {"type": "boolean", "default": False},
+                    "options": {"type": "array", "items": {"type": "string"}, "unique": True},
+                },
+            },
+        },
+    },
+    "required": ["questions"],
+}
+
+_FENCE = re.compile(r"^\s*```[a-zA-Z]*\s*|\s*```\s*$")
+
+Validator = Callable[[Any, str, List[str]], Any]
+_MISSING = object()
+
+
+def _compile(schema: Dict[str, Any]) -> Validator:
+    kind = schema["type"]
+
+    if kind == "string":
+        def validate_string(value, path, errors):
+            if isinstance(value, str):
+                return value.strip()
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return str(value)
+            errors.append(f"{path}: expected string")
+            return _MISSING
+        return validate_string
+
+    if kind == "boolean":
+        def validate_boolean(value, path, errors):
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, (int, float)):
+                return bool(value)
+            if isinstance(value, str) and value.strip().lower() in ("true", "yes", "1", "false", "no", "0"):
+                return value.strip().lower() in ("true", "yes", "1")
+            errors.append(f"{path}: expected boolean")
+            return _MISSING
+        return validate_boolean
+
+    if kind == "enum":
+        values = schema["values"]
+
+        def validate_enum(value, path, errors):
+            normalized = re.sub(r"[\s\-]+", "_", str(value).strip().lower())
+            if normalized in values:
+                return values[normalized]
+            errors.append(f"{path}: unknown value {value!r}")
+            return _MISSING
+        return validate_enum
+
+    if kind == "array":
+        item = _compile(schema["items"])
+        min_items = schema.get("min_items", 0)
+        unique = schema.get("unique", False)
+
+        def validate_array(value, path, errors):
+            if isinstance(value, str) and schema["items"]["type"] == "string":
+                value = [part for part in re.split(r"[;\n|]", value) if part.strip()]
+            if not isinstance(value, list):
+                errors.append(f"{path}: expected array")
+                return _MISSING
+            result = []
+            for position, element in enumerate(value):
+                checked = item(element, f"{path}[{position}]", errors)
+                if checked is _MISSING or checked in ("", None):
+                    continue
+                if unique and checked in result:
+                    continue
+                result.append(checked)
+            if len(result) < min_items:
+                errors.append(f"{path}: expected at least {min_items} valid items")
+                return _MISSING
+            return result
+        return validate_array
+
+    if kind == "object":
+        fields = {name: (_compile(spec), spec) for name, spec in schema["properties"].items()}
+        required = schema.get("required", [])
+
+        def validate_object(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append(f"{path}: expected object")
+                return _MISSING
+            result = {}
+            for name, (check, spec) in fields.items():
+                present = name in value and value[name] is not None
+                if present:
+                    checked = check(value[name], f"{path}.{name}", errors)
+                    if checked is not _MISSING and checked != "":
+                        result[name] = checked
+                        continue
+                if name in required:
+                    if not present or value[name] == "":
+                        errors.append(f"{path}.{name}: required")
+                    return _MISSING
+                if "default" in spec:
+                    result[name] = spec["default"]
+            return result
+        return validate_object
+
+    raise ValueError(f"unsupported schema type {kind}")
+
+
+_validate_blueprint = _compile(BLUEPRINT_SCHEMA)
+_validate_question = _compile(BLUEPRINT_SCHEMA["properties"]["questions"]["items"])
+
+
+def _fix_options(question: Dict[str, Any]) -> Dict[str, Any]:
+    if question.get("type") != "multiple_choice":
+        question.pop("options", None)
+        return question
+    options = question.get("options") or []
+    if len(options) < MIN_OPTIONS:
+        # Too few choices to be a useful multiple choice question
+        question["type"] = "text"
+        question.pop("options", None)
+    else:
+        question["options"] = options[:MAX_OPTIONS]
+    return question
+
+
+def validate_question(question: Any, path: str = "question") -> Tuple[Optional[Dict[str, Any]], List[str]]:
+    errors: List[str] = []
+    checked = _validate_question(question, path, errors)
+    if checked is _MISSING:
+        return None, errors
+    return _fix_options(checked), errors
+
+
+def validate_blueprint(data: Any, num_questions: Optional[int] = None) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+    """Checks and coerces a blueprint; returns ``(None, errors)`` when unusable."""
+    errors: List[str] = []
+    if isinstance(data, dict) and isinstance(data.get("questions"), list):
+        # Drop broken questions individually instead of failing the whole blueprint
+        questions = []
+        for position, question in enumerate(data["questions"]):
+            checked, question_errors = validate_question(question, f"questions[{position}]")
+            errors.extend(question_errors)
+            if checked is not None:
+                questions.append(checked)
+        data = dict(data, questions=questions)
+
+    blueprint = _validate_blueprint(data, "blueprint", errors)
+    if blueprint is _MISSING:
+        return None, errors
+    if num_questions:
+        blueprint["questions"] = blueprint["questions"][:num_questions]
+    return blueprint, errors
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """Drops commas right before ``}`` or ``]``, leaving string contents alone."""
+    result = []
+    in_string = False
+    escaped = False
+    for position, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "," and text[position + 1:].lstrip()[:1] in ("}", "]"):
+            continue
+        result.append(char)
+    return "".join(result)
+
+
+def repair_json(text: str) -> Tuple[Optional[Any], List[str]]:
+    """Parses model output, fixing the common ways it comes back malformed.
+
+    Returns the parsed value (or ``None``) and the repairs that were applied.
+    """
+    repairs: List[str] = []
+    candidate = text or ""
+    stripped = _FENCE.sub("", candidate)
+    if stripped != candidate:
+        repairs.append("code_fence")
+        candidate = stripped
+
+    start = candidate.find("{")
+    end = candidate.rfind("}")
+    if start > 0 or (end != -1 and end < len(candidate.rstrip()) - 1):
+        repairs.append("surrounding_text")
+    if start != -1:
+        candidate = candidate[start:end + 1] if end > start else candidate[start:]
+
+    try:
+        return json.loads(candidate), repairs
+    except json.JSONDecodeError:
+        pass
+
+    fixed = _strip_trailing_commas(candidate)
+    if fixed != candidate:
+        repairs.append("trailing_comma")
+        candidate = fixed
+        try:
+            return json.loads(candidate), repairs
+        except json.JSONDecodeError:
+            pass
+
+    # Output cut off mid-way: keep the fields and questions that did complete
+    parser = BlueprintStreamParser()
+    parser.feed(candidate)
+    if parser.questions or parser.fields:
+        repairs.append("truncated")
+        return parser.result(), repairs
+    return None, repairs
+
+
+class RepairStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {"valid": 0, "repaired": 0, "retried": 0, "failed": 0}
+
+    def count(self, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+REPAIR_STATS = RepairStats()
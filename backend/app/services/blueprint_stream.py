@@ -0,0 +1,125 @@
+import json
+from typing import Any, Dict, List, Tuple
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+class BlueprintStreamParser:
+    """Incrementally parses a streamed blueprint object.
+
+    ``feed`` takes the next chunk of model output and returns the fields that
+    became complete: ``("title", str)``, ``("description", str)`` and one
+    ``("question", dict)`` per finished element of the ``questions`` array, so
+    callers can act on each question while the rest is still being generated.
+    """
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self.pos = 0
+        self.state = "start"
+        self.key = ""
+        self.fields: Dict[str, Any] = {}
+        self.questions: List[Dict[str, Any]] = []
+
+    @property
+    def done(self) -> bool:
+        return self.state == "done"
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        self.buffer += text
+        events: List[Tuple[str, Any]] = []
+        while self._step(events):
+            pass
+        return events
+
+    def result(self) -> Dict[str, Any]:
+        blueprint = dict(self.fields)
+        blueprint["questions"] = list(self.questions)
+        return blueprint
+
+    def _skip(self) -> None:
+        while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+            self.pos += 1
+
+    def _decode(self) -> Tuple[bool, Any]:
+        try:
+            value, end = _decoder.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError:
+            return False, None
+        # A number at the very end of the buffer may still grow
+        if end >= len(self.buffer) and not isinstance(value, (str, dict, list)):
+            return False, None
+        self.pos = end
+        return True, value
+
+    def _step(self, events: List[Tuple[str, Any]]) -> bool:
+        if self.state == "start":
+            # Skip markdown fences or chatter before the object
+            start = self.buffer.find("{", self.pos)
+            if start == -1:
+                self.pos = len(self.buffer)
+                return False
+            self.pos = start + 1
+            self.state = "key"
+            return True
+
+        self._skip()
+        if self.pos >= len(self.buffer):
+            return False
+        char = self.buffer[self.pos]
+
+        if self.state == "key":
+            if char == ",":
+                self.pos += 1
+                return True
+            if char == "}":
+                self.pos += 1
+                self.state = "done"
+                return False
+            complete, key = self._decode()
+            if not complete:
+                return False
+            self.key = str(key)
+            self.state = "colon"
+            return True
+
+        if self.state == "colon":
+            if char != ":":
+                self.state = "done"
+                return False
+            self.pos += 1
+            self.state = "value"
+            return True
+
+        if self.state == "value":
+            if self.key == "questions" and char == "[":
+                self.pos += 1
+                self.state = "questions"
+                return True
+            complete, value = self._decode()
+            if not complete:
+                return False
+            self.fields[self.key] = value
+            if self.key in ("title", "description") and isinstance(value, str):
+                events.append((self.key, value))
+            self.state = "key"
+            return True
+
+        if self.state == "questions":
+            if char == ",":
+                self.pos += 1
+                return True
+            if char == "]":
+                self.pos += 1
+                self.state = "key"
+                return True
+            complete, value = self._decode()
+            if not complete:
+                return False
+            if isinstance(value, dict):
+                self.questions.append(value)
+                events.append(("question", value))
+            return True
+
+        return False
@@ -0,0 +1,156 @@
+import hashlib
+import random
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+STOPWORDS = frozenset(
+    "a an and about at by for from in of on or the to with survey form questionnaire "
+    "cho của và về với các những một khảo sát".split()
+)
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def _tokens(text: str) -> List[str]:
+    return [word for word in _WORD.findall((text or "").lower()) if word not in STOPWORDS]
+
+
+def shingles(topic: str, audience: str) -> FrozenSet[str]:
+    """Word and character 3-gram shingles; word order does not matter."""
+    result = set()
+    for prefix, text in (("t", topic), ("a", audience)):
+        for word in _tokens(text):
+            result.add(f"{prefix}:{word}")
+            padded = f"^{word}$"
+            for start in range(len(padded) - 2):
+                result.add(f"{prefix}#{padded[start:start + 3]}")
+    return frozenset(result)
+
+
+def _hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def minhash(items: FrozenSet[str]) -> Tuple[int, ...]:
+    hashes = [_hash(item) for item in items] or [0]
+    return tuple(min((a * value + b) % _PRIME for value in hashes) for a, b in _PERMUTATIONS)
+
+
+def jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+class BriefIndex:
+    """MinHash/LSH index of briefs that already have a cached blueprint.
+
+    Briefs are compared on topic and audience; language, model and
+    temperature must match and the cached blueprint must actually hold at
+    least as many questions as requested. Banding keeps lookups from scanning every entry, and candidates
+    are scored by exact Jaccard similarity of their shingle sets.
+    """
+
+    def __init__(self, threshold: float = 0.8, size: int = 5000) -> None:
+        self.threshold = float(threshold)
+        self.size = max(0, int(size))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._buckets: Dict[Tuple[Any, ...], set] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return 0 < self.threshold <= 1 and self.size > 0
+
+    def add(self, key: str, inputs: Dict[str, Any], questions: int) -> None:
+        if not self.enabled:
+            return
+        items = shingles(inputs.get("topic", ""), inputs.get("audience", ""))
+        signature = minhash(items)
+        partition = self._partition(inputs)
+        with self._lock:
+            self._remove(key)
+            bands = [(partition, band, signature[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+            self._entries[key] = {
+                "inputs": dict(inputs),
+                "questions": int(questions),
+                "shingles": items,
+                "bands": bands,
+            }
+            for band in bands:
+                self._buckets.setdefault(band, set()).add(key)
+            while len(self._entries) > self.size:
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def lookup(self, inputs: Dict[str, Any], exclude: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        items = shingles(inputs.get("topic", ""), inputs.get("audience", ""))
+        signature = minhash(items)
+        partition = self._partition(inputs)
+        wanted = int(inputs.get("num_questions") or 0)
+
+        best = None
+        with self._lock:
+            candidates = set()
+            for band in range(BANDS):
+                candidates |= self._buckets.get((partition, band, signature[band * ROWS:(band + 1) * ROWS]), set())
+            candidates.discard(exclude)
+            for key in candidates:
+                entry = self._entries[key]
+                if entry["questions"] < wanted:
+                    continue
+                score = jaccard(items, entry["shingles"])
+                if score >= self.threshold and (best is None or score > best["similarity"]):
+                    best = {"key": key, "similarity": round(score, 4), "inputs": entry["inputs"]}
+            if best is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(best["key"])
+        return best
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "threshold": self.threshold,
+                "size": len(self._entries),
+                "max_size": self.size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    @staticmethod
+    def _partition(inputs: Dict[str, Any]) -> Tuple[str, str, float]:
+        # Only briefs the exact cache key would also treat alike are interchangeable
+        return (
+            str(inputs.get("language", "")).strip().lower(),
+            str(inputs.get("model", "")),
+            float(inputs.get("temperature") or 0),
+        )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band in entry["bands"]:
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
@@ -1,10 +1,81 @@
 from flask import current_app
-from pymongo.errors import PyMongoError
+from pymongo.errors import DuplicateKeyError, PyMongoError
 from bson import ObjectId
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fields every login, register and Google flow looks users up by. Username and
+# google_id are optional, so only documents that have them are indexed.
+USER_INDEXES = [
+    ("email", {"unique": True, "name": "email_unique"}),
+    ("username", {
+        "unique": True,
+        "name": "username_unique",
+        "partialFilterExpression": {"username": {"$type": "string"}},
+    }),
+    ("google_id", {
+        "unique": True,
+        "name": "google_id_unique",
+        "partialFilterExpression": {"google_id": {"$type": "string"}},
+    }),
+]
+
+
+# Fields a user profile may show; password hashes never leave the auth check
+PUBLIC_USER_FIELDS = [
+    "name", "username", "email", "picture", "role", "auth_provider",
+    "is_active", "email_verified", "created_at", "updated_at", "last_login",
+]
+
+# Named projections so each endpoint reads only the fields it needs
+PROJECTIONS = {
+    "exists": {"_id": 1},
+    "user_public": {field: 1 for field in PUBLIC_USER_FIELDS},
+    "user_auth": dict({field: 1 for field in PUBLIC_USER_FIELDS}, password=1),
+    "user_google": dict({field: 1 for field in PUBLIC_USER_FIELDS}, google_id=1),
+}
+
+
+def resolve_projection(projection):
+    """Accepts a projection dict or the name of one in ``PROJECTIONS``"""
+    if isinstance(projection, str):
+        return PROJECTIONS[projection]
+    return projection
+
+
+def _user_cache():
+    return getattr(current_app, "user_cache", None)
+
+
+def _cached_user_id(collection_name: str, filter_dict: dict, projection):
+    # Only by-id reads of the public profile are cached, e.g. token verification
+    if collection_name != "users" or projection != "user_public" or not filter_dict:
+        return None
+    if set(filter_dict) != {"_id"} or not isinstance(filter_dict["_id"], (str, ObjectId)):
+        return None
+    return str(filter_dict["_id"])
+
+
+def _invalidate_user(collection_name: str, filter_dict: dict) -> None:
+    cache = _user_cache()
+    if collection_name != "users" or cache is None:
+        return
+    user_id = (filter_dict or {}).get("_id")
+    cache.invalidate(str(user_id) if isinstance(user_id, (str, ObjectId)) else None)
+
+
+def duplicate_key_field(error: DuplicateKeyError):
+    """Name of the field that caused a duplicate key error, if it can be told"""
+    details = getattr(error, "details", None) or {}
+    fields = list((details.get("keyPattern") or details.get("keyValue") or {}).keys())
+    if fields:
+        return fields[0]
+    for field, _ in USER_INDEXES:
+        if f"{field}_unique" in str(error):
+            return field
+    return None
+
 
 class DatabaseService:
     
@@ -14,18 +85,40 @@ class DatabaseService:
             raise Exception("Database not initialized")
         return current_app.db
     
+    @staticmethod
+    def ensure_indexes(db):
+        """Creates the unique user indexes; safe to run on every start"""
+        if db is None:
+            return
+        for field, options in USER_INDEXES:
+            try:
+                db["users"].create_index(field, **options)
+            except PyMongoError as e:
+                # Existing duplicates have to be cleaned up before the index can be built
+                logger.warning(f"Could not create users.{field} index: {e}")
+
     @staticmethod
     def insert_one(collection_name: str, document: dict):
         try:
             db = DatabaseService.get_db()
             result = db[collection_name].insert_one(document)
             return str(result.inserted_id)
+        except DuplicateKeyError:
+            # Expected when a unique field is taken; callers decide what to do
+            raise
         except PyMongoError as e:
             logger.error(f"Error inserting document: {e}")
             raise
     
     @staticmethod
-    def find_one(collection_name: str, filter_dict: dict = None):
+    def find_one(collection_name: str, filter_dict: dict = None, projection=None):
+        cache = _user_cache()
+        user_id = _cached_user_id(collection_name, filter_dict, projection) if cache is not None else None
+        if user_id is not None:
+            cached = cache.get(user_id)
+            if cached is not None:
+                return cached
+            epoch = cache.epoch
         try:
             db = DatabaseService.get_db()
             
@@ -35,19 +128,40 @@ class DatabaseService:
                     filter_dict = dict(filter_dict)  # Make a copy
                     filter_dict['_id'] = ObjectId(filter_dict['_id'])
             
-            result = db[collection_name].find_one(filter_dict or {})
+            result = db[collection_name].find_one(filter_dict or {}, resolve_projection(projection))
             if result and '_id' in result:
                 result['_id'] = str(result['_id'])
+            if result and user_id is not None:
+                cache.set(user_id, result, epoch)
             return result
         except PyMongoError as e:
             logger.error(f"Error finding document: {e}")
             raise
     
     @staticmethod
-    def find_many(collection_name: str, filter_dict: dict = None, limit: int = None):
+    def find_many(
+        collection_name: str,
+        filter_dict: dict = None,
+        limit: int = None,
+        projection=None,
+        sort: list = None,
+        after: str = None,
+    ):
+        """Returns matching documents; pass ``after`` (an ``_id``) to read the next page.
+
+        Pages are keyed on ``_id`` rather than skipped over, so each page costs
+        the same however deep it is. ``after`` implies ascending ``_id`` order.
+        """
         try:
             db = DatabaseService.get_db()
-            cursor = db[collection_name].find(filter_dict or {})
+            filter_dict = filter_dict or {}
+            if after is not None:
+                after_filter = {"_id": {"$gt": ObjectId(after) if isinstance(after, str) else after}}
+                filter_dict = {"$and": [filter_dict, after_filter]} if filter_dict else after_filter
+                sort = sort or [("_id", 1)]
+            cursor = db[collection_name].find(filter_dict, resolve_projection(projection))
+            if sort:
+                cursor = cursor.sort(sort)
             if limit:
                 cursor = cursor.limit(limit)
             
@@ -61,6 +175,36 @@ class DatabaseService:
             logger.error(f"Error finding documents: {e}")
             raise
     
+    @staticmethod
+    def stream(
+        collection_name: str,
+        filter_dict: dict = None,
+        projection=None,
+        sort: list = None,
+        batch_size: int = 500,
+    ):
+        """Yields documents one at a time, fetching ``batch_size`` per round trip.
+
+        Unlike ``find_many`` nothing is collected, so memory stays flat for
+        whole-collection reads such as exports.
+        """
+        db = DatabaseService.get_db()
+        cursor = db[collection_name].find(
+            filter_dict or {}, resolve_projection(projection), batch_size=batch_size
+        )
+        if sort:
+            cursor = cursor.sort(sort)
+        try:
+            for doc in cursor:
+                if '_id' in doc:
+                    doc['_id'] = str(doc['_id'])
+                yield doc
+        except PyMongoError as e:
+            logger.error(f"Error streaming documents: {e}")
+            raise
+        finally:
+            cursor.close()
+    
     @staticmethod
     def update_one(collection_name: str, filter_dict: dict, update_dict: dict):
         try:
@@ -76,6 +220,9 @@ class DatabaseService:
         except PyMongoError as e:
             logger.error(f"Error updating document: {e}")
             raise
+        finally:
+            # A failed write may still have been applied, so drop the entry either way
+            _invalidate_user(collection_name, filter_dict)
     
     @staticmethod
     def delete_one(collection_name: str, filter_dict: dict):
@@ -86,3 +233,5 @@ class DatabaseService:
         except PyMongoError as e:
             logger.error(f"Error deleting document: {e}")
             raise
+        finally:
+            _invalidate_user(collection_name, filter_dict)
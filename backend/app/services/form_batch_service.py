@@ -0,0 +1,119 @@
+import csv
+import io
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from flask import current_app
+
+from app.utils.rate_limit import TokenBucket
+
+from .form_generation_service import create_form_from_blueprint, estimate_forms_calls, generate_form_blueprint
+
+BRIEF_FIELDS = ("topic", "audience", "language", "num_questions")
+
+def build_rate_limiters(config: Any) -> Dict[str, TokenBucket]:
+    """One bucket per quota-limited API, shared by every batch in the process."""
+    return {
+        "llm": TokenBucket.per_minute(config.get("LLM_RATE_LIMIT_PER_MIN", 60)),
+        "forms": TokenBucket.per_minute(config.get("FORMS_RATE_LIMIT_PER_MIN", 120)),
+    }
+
+
+def get_rate_limiters() -> Dict[str, TokenBucket]:
+    return current_app.rate_limiters
+
+
+def parse_briefs(data: Any, csv_text: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    if csv_text is not None:
+        reader = csv.DictReader(io.StringIO(csv_text.lstrip("\ufeff")))
+        briefs = [
+            {field: (row.get(field) or "").strip() for field in BRIEF_FIELDS if (row.get(field) or "").strip()}
+            for row in reader
+        ]
+    elif isinstance(data, list):
+        briefs = data
+    elif isinstance(data, dict) and isinstance(data.get("briefs"), list):
+        defaults = data.get("defaults") or {}
+        briefs = [dict(defaults, **brief) if isinstance(brief, dict) else brief for brief in data["briefs"]]
+    else:
+        return [], "missing_briefs"
+
+    if not briefs:
+        return [], "missing_briefs"
+    if not all(isinstance(brief, dict) for brief in briefs):
+        return [], "invalid_brief"
+    limit = int(current_app.config.get("FORM_BATCH_MAX_ITEMS", 100))
+    if len(briefs) > limit:
+        return [], "too_many_briefs"
+    return briefs, None
+
+
+def run_batch(briefs: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Generates and creates a form per brief, yielding each result as it finishes.
+
+    Generation and form creation run on separate pools with their own
+    concurrency limits, and each draws from its app-wide token bucket, so
+    throughput follows the OpenAI and Forms API quotas.
+    """
+    app = current_app._get_current_object()
+    config = app.config
+    limiters = get_rate_limiters()
+    results: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+    llm_pool = ThreadPoolExecutor(max_workers=max(1, int(config.get("FORM_BATCH_LLM_CONCURRENCY", 4))))
+    forms_pool = ThreadPoolExecutor(max_workers=max(1, int(config.get("FORM_BATCH_FORMS_CONCURRENCY", 2))))
+    started = time.perf_counter()
+
+    def finish(index: int, brief: Dict[str, Any], result: Dict[str, Any]) -> None:
+        result = dict(result, index=index, brief=brief)
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        results.put(result)
+
+    def create(index: int, brief: Dict[str, Any], draft: Dict[str, Any]) -> None:
+        try:
+            with app.app_context():
+                limiters["forms"].acquire(estimate_forms_calls(draft["blueprint"]))
+                created = create_form_from_blueprint(draft["blueprint"])
+            created["cached"] = draft.get("cached", False)
+            for field in ("usage", "similar"):
+                if field in draft:
+                    created[field] = draft[field]
+            finish(index, brief, created)
+        except Exception as e:
+            finish(index, brief, {"ok": False, "error": "form_create_failed", "detail": str(e)})
+
+    def generate(index: int, brief: Dict[str, Any]) -> None:
+        try:
+            with app.app_context():
+                draft = generate_form_blueprint(brief, limiter=limiters["llm"])
+        except Exception as e:
+            draft = {"ok": False, "error": "generation_failed", "detail": str(e)}
+        if not draft.get("ok"):
+            finish(index, brief, draft)
+            return
+        forms_pool.submit(create, index, brief, draft)
+
+    try:
+        for index, brief in enumerate(briefs):
+            llm_pool.submit(generate, index, brief)
+        yield {"event": "start", "data": {"total": len(briefs)}}
+
+        succeeded = 0
+        for _ in briefs:
+            result = results.get()
+            succeeded += 1 if result.get("ok") else 0
+            yield {"event": "item", "data": result}
+
+        yield {"event": "done", "data": {
+            "ok": True,
+            "total": len(briefs),
+            "succeeded": succeeded,
+            "failed": len(briefs) - succeeded,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "rate_limits": {name: limiter.stats() for name, limiter in limiters.items()},
+        }}
+    finally:
+        # A client that disconnects early cancels briefs that have not started
+        llm_pool.shutdown(wait=False, cancel_futures=True)
+        forms_pool.shutdown(wait=False)
@@ -1,34 +1,89 @@
 import json
-from typing import Any, Dict, List
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from flask import current_app
-from openai import OpenAI
 
-from .mcp_service import call_mcp_tool
+from .blueprint_cache import BlueprintCache, blueprint_cache_key
+from .blueprint_schema import REPAIR_STATS, repair_json, validate_blueprint, validate_question
+from .blueprint_stream import BlueprintStreamParser
+from .brief_index import BriefIndex
+from .form_jobs import FormJobQueue
+from .llm_service import generate_text, get_llm
+from .mcp_service import call_mcp_tool, call_mcp_tools, get_clients, list_mcp_tools
+
+# All of these are attached to the app in create_app
+def get_blueprint_cache() -> BlueprintCache:
+    return current_app.blueprint_cache
+
+
+def get_brief_index() -> BriefIndex:
+    return current_app.brief_index
+
+
+def get_form_jobs() -> FormJobQueue:
+    return current_app.form_jobs
+
+
+def _is_true(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+# Kept byte-for-byte identical across requests so the provider can reuse its
+# cached prefix; everything request-specific goes in the user message.
+SYSTEM_PROMPT = (
+    "You generate survey form blueprints as JSON. "
+    "Return ONLY valid JSON with keys in this order: title, description, questions. "
+    "Each question has: type ('text' or 'multiple_choice'), title, required, "
+    "and for multiple_choice include options array of 3-6 short strings. "
+    "Generate exactly the requested number of questions with a balanced mix of question types, "
+    "written in the requested language. "
+    "Keep wording concise and professional."
+)
+
+# Rough output tokens per question relative to English, by tokenizer efficiency
+LANGUAGE_TOKEN_FACTORS = {
+    "english": 1.0,
+    "en": 1.0,
+    "vietnamese": 1.6,
+    "tiếng việt": 1.6,
+    "vi": 1.6,
+    "thai": 2.0,
+    "chinese": 1.3,
+    "japanese": 1.4,
+    "korean": 1.4,
+}
+DEFAULT_LANGUAGE_FACTOR = 1.3
+BASE_OUTPUT_TOKENS = 80
+OUTPUT_TOKENS_PER_QUESTION = 70
+MIN_OUTPUT_TOKENS = 200
+
+
+def output_token_budget(num_questions: int, language: str, cap: int = 4096) -> int:
+    factor = LANGUAGE_TOKEN_FACTORS.get((language or "").strip().lower(), DEFAULT_LANGUAGE_FACTOR)
+    # A quarter of headroom so long option lists do not get cut off
+    budget = (BASE_OUTPUT_TOKENS + OUTPUT_TOKENS_PER_QUESTION * num_questions) * factor * 1.25
+    return int(min(cap, max(MIN_OUTPUT_TOKENS, budget)))
 
 
 def _build_prompt(topic: str, audience: str, language: str, num_questions: int) -> List[Dict[str, str]]:
-    system = (
-        "You generate survey form blueprints as JSON. "
-        "Return ONLY valid JSON with keys: title, description, questions. "
-        "Each question has: type ('text' or 'multiple_choice'), title, required, "
-        "and for multiple_choice include options array of 3-6 short strings. "
-        "Keep wording concise and professional."
-    )
     user = (
         f"Topic: {topic}\n"
         f"Audience: {audience}\n"
         f"Language: {language}\n"
-        f"Number of questions: {num_questions}\n"
-        "Generate a balanced mix of question types."
+        f"Number of questions: {num_questions}"
     )
     return [
-        {"role": "system", "content": system},
+        {"role": "system", "content": SYSTEM_PROMPT},
         {"role": "user", "content": user},
     ]
 
 
-def generate_form_blueprint(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_inputs(payload: Dict[str, Any]) -> Dict[str, Any]:
     topic = (payload.get("topic") or "").strip()
     audience = (payload.get("audience") or "General").strip()
     language = (payload.get("language") or "Vietnamese").strip()
@@ -41,21 +96,170 @@ def generate_form_blueprint(payload: Dict[str, Any]) -> Dict[str, Any]:
     if num_questions > 20:
         num_questions = 20
 
-    client = OpenAI(api_key=current_app.config.get("OPENAI_API_KEY"))
-    response = client.responses.create(
-        model=current_app.config.get("OPENAI_MODEL"),
-        input=_build_prompt(topic, audience, language, num_questions),
-        temperature=current_app.config.get("OPENAI_TEMPERATURE"),
-        max_output_tokens=current_app.config.get("OPENAI_MAX_TOKENS"),
+    return {
+        "ok": True,
+        "topic": topic,
+        "audience": audience,
+        "language": language,
+        "num_questions": num_questions,
+        "model": current_app.config.get("OPENAI_MODEL"),
+        "temperature": current_app.config.get("OPENAI_TEMPERATURE"),
+        "max_tokens": output_token_budget(
+            num_questions,
+            language,
+            cap=int(current_app.config.get("OPENAI_MAX_TOKENS_CAP", 4096)),
+        ),
+    }
+
+
+def _cache_key(inputs: Dict[str, Any]) -> str:
+    return blueprint_cache_key(
+        inputs["topic"],
+        inputs["audience"],
+        inputs["language"],
+        inputs["num_questions"],
+        inputs["model"],
+        inputs["temperature"],
     )
 
-    content = response.output_text or ""
-    try:
-        blueprint = json.loads(content)
-    except json.JSONDecodeError:
-        return {"ok": False, "error": "invalid_json_from_model", "raw": content}
 
-    return {"ok": True, "blueprint": blueprint}
+def _prompt_for(inputs: Dict[str, Any]) -> List[Dict[str, str]]:
+    return _build_prompt(inputs["topic"], inputs["audience"], inputs["language"], inputs["num_questions"])
+
+
+def _parse_blueprint(content: str, num_questions: int) -> Tuple[Optional[Dict[str, Any]], List[str], bool]:
+    """Returns the blueprint, the problems found and whether the output was cut off."""
+    data, repairs = repair_json(content)
+    if data is None:
+        return None, ["output is not valid JSON"], False
+    blueprint, errors = validate_blueprint(data, num_questions)
+    if blueprint is not None:
+        REPAIR_STATS.count("repaired" if repairs or errors else "valid")
+    return blueprint, errors, "truncated" in repairs
+
+
+def _reuse_blueprint(inputs: Dict[str, Any], key: str) -> Optional[Dict[str, Any]]:
+    cache = get_blueprint_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        return {"ok": True, "blueprint": cached, "cached": True}
+
+    # A reworded brief for the same thing can reuse that blueprint
+    index = get_brief_index()
+    match = index.lookup(inputs, exclude=key)
+    if match is None:
+        return None
+    # The exact lookup above already counted this request
+    blueprint = cache.get(match["key"], count=False)
+    if blueprint is None:
+        index.discard(match["key"])
+        return None
+    blueprint["questions"] = (blueprint.get("questions") or [])[:inputs["num_questions"]]
+    return {
+        "ok": True,
+        "blueprint": blueprint,
+        "cached": True,
+        "similar": {
+            "similarity": match["similarity"],
+            "topic": match["inputs"].get("topic"),
+            "audience": match["inputs"].get("audience"),
+        },
+    }
+
+
+def _remember_blueprint(inputs: Dict[str, Any], key: str, blueprint: Dict[str, Any]) -> None:
+    # A short blueprint is fine to return once but must not stand in for the full answer
+    if len(blueprint.get("questions") or []) < inputs["num_questions"]:
+        return
+    stored = {name: value for name, value in inputs.items() if name not in ("ok", "max_tokens")}
+    get_blueprint_cache().set(key, blueprint, stored)
+    get_brief_index().add(key, stored, len(blueprint["questions"]))
+
+
+def generate_form_blueprint(payload: Dict[str, Any], limiter: Any = None) -> Dict[str, Any]:
+    inputs = _parse_inputs(payload)
+    if not inputs["ok"]:
+        return inputs
+
+    key = _cache_key(inputs)
+    if not _is_true(payload.get("fresh")):
+        reused = _reuse_blueprint(inputs, key)
+        if reused is not None:
+            return reused
+
+    # Only calls that actually reach the model count against its rate limit
+    if limiter is not None:
+        limiter.acquire()
+    response = generate_text(
+        _prompt_for(inputs),
+        label="form_blueprint",
+        model=inputs["model"],
+        temperature=inputs["temperature"],
+        max_tokens=inputs["max_tokens"],
+    )
+    if not response.get("ok"):
+        return response
+
+    content = response["text"]
+    usage = response["usage"]
+    truncated = bool(response.get("truncated"))
+    blueprint, problems, partial = _parse_blueprint(content, inputs["num_questions"])
+    if blueprint is None:
+        # Repair could not save it; ask once more, saying what was wrong
+        REPAIR_STATS.count("retried")
+        if limiter is not None:
+            limiter.acquire()
+        retry = generate_text(
+            _prompt_for(inputs) + [
+                {"role": "assistant", "content": content[:4000]},
+                {"role": "user", "content": (
+                    "That reply could not be used: " + "; ".join(problems[:5])
+                    + ". Return only the corrected JSON object."
+                )},
+            ],
+            label="form_blueprint_retry",
+            model=inputs["model"],
+            temperature=inputs["temperature"],
+            max_tokens=inputs["max_tokens"],
+        )
+        if not retry.get("ok"):
+            return retry
+        usage = {name: usage[name] + retry["usage"][name] for name in usage}
+        truncated = bool(retry.get("truncated"))
+        blueprint, problems, partial = _parse_blueprint(retry["text"], inputs["num_questions"])
+        if blueprint is None:
+            REPAIR_STATS.count("failed")
+            return {"ok": False, "error": "invalid_json_from_model", "raw": retry["text"], "problems": problems}
+
+    if not (truncated or partial):
+        _remember_blueprint(inputs, key, blueprint)
+    return {
+        "ok": True,
+        "blueprint": blueprint,
+        "cached": False,
+        "usage": usage,
+        "max_output_tokens": inputs["max_tokens"],
+        "truncated": truncated or partial,
+    }
+
+
+def run_form_generation(
+    payload: Dict[str, Any],
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    progress = progress or (lambda stage: None)
+    progress("generating")
+    draft = generate_form_blueprint(payload)
+    if not draft.get("ok"):
+        return draft
+
+    progress("creating")
+    created = create_form_from_blueprint(draft["blueprint"])
+    created["cached"] = draft.get("cached", False)
+    for field in ("usage", "max_output_tokens", "truncated", "similar"):
+        if field in draft:
+            created[field] = draft[field]
+    return created
 
 
 def _extract_mcp_json(mcp_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -70,6 +274,140 @@ def _extract_mcp_json(mcp_result: Dict[str, Any]) -> Dict[str, Any]:
         return {}
 
 
+def _question_call(form_id: str, index: int, question: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    payload = {
+        "formId": form_id,
+        "questionTitle": question.get("title"),
+        "required": bool(question.get("required", False)),
+        "index": index,
+    }
+    if question.get("type") == "multiple_choice":
+        payload["options"] = question.get("options", [])
+        return "add_multiple_choice_question", payload
+    return "add_text_question", payload
+
+
+def _tool_error(result: Dict[str, Any]) -> Optional[str]:
+    if "error" in result:
+        error = result["error"]
+        return error if isinstance(error, str) else error.get("message", "mcp_error")
+    tool_result = result.get("result") or {}
+    if tool_result.get("isError"):
+        content = tool_result.get("content") or [{}]
+        return content[0].get("text") or "tool_error"
+    return None
+
+
+def _add_questions(form_id: str, questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    calls = [_question_call(form_id, index, question) for index, question in enumerate(questions)]
+    if not calls:
+        return []
+
+    limit = max(1, int(current_app.config.get("FORM_QUESTION_CONCURRENCY", 5)))
+    # Each chunk is written to the server in one flush and runs concurrently
+    # there. Questions go in at their blueprint index; the server clamps
+    # indexes past the end, so reorder_items below restores exact order.
+    results = []
+    for start in range(0, len(calls), limit):
+        results.extend(call_mcp_tools("google_forms", calls[start:start + limit]))
+
+    return [
+        _question_entry(index, payload, result)
+        for index, ((_, payload), result) in enumerate(zip(calls, results))
+    ]
+
+
+def _question_entry(index: int, payload: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+    error = _tool_error(result)
+    entry = {"index": index, "ok": error is None, "question": payload, "result": result}
+    if error is None:
+        entry["itemId"] = _extract_mcp_json(result).get("itemId")
+    else:
+        entry["error"] = error
+    return entry
+
+
+def _has_tool(server: str, tool: str) -> bool:
+    # tools/list is cached by the client, so this is normally free
+    listing = list_mcp_tools(server)
+    tools = (listing.get("result") or {}).get("tools") or []
+    return any(item.get("name") == tool for item in tools)
+
+
+def _rejected(result: Dict[str, Any]) -> bool:
+    """True when the server answered with an error, as opposed to a transport failure."""
+    return isinstance(result.get("error"), dict) or bool((result.get("result") or {}).get("isError"))
+
+
+def _confirm_bulk(form_id: str, specs: List[Dict[str, Any]], error: str) -> List[Dict[str, Any]]:
+    form = _extract_mcp_json(call_mcp_tool("google_forms", "get_form", {"formId": form_id}))
+    items = form.get("items") or []
+    applied = bool(form.get("formId")) and len(items) == len(specs)
+    entries = []
+    for index, spec in enumerate(specs):
+        entry = {"index": index, "ok": applied, "question": spec}
+        if applied:
+            entry["itemId"] = items[index].get("itemId")
+        else:
+            entry["error"] = error
+        entries.append(entry)
+    return entries
+
+
+def _add_questions_bulk(form_id: str, questions: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    specs = []
+    for question in questions:
+        spec = {
+            "type": "multiple_choice" if question.get("type") == "multiple_choice" else "text",
+            "questionTitle": question.get("title"),
+            "required": bool(question.get("required", False)),
+        }
+        if spec["type"] == "multiple_choice":
+            spec["options"] = question.get("options", [])
+        specs.append(spec)
+
+    result = call_mcp_tool("google_forms", "add_questions", {"formId": form_id, "questions": specs})
+    error = _tool_error(result)
+    if error is not None and _rejected(result):
+        # The server refused the update, so nothing was added
+        return None
+    if error is not None:
+        # Timeouts and lost processes leave it unknown whether the update was
+        # applied; adding the questions again could duplicate all of them
+        return _confirm_bulk(form_id, specs, error)
+
+    item_ids = _extract_mcp_json(result).get("itemIds") or []
+    return [
+        {
+            "index": index,
+            "ok": True,
+            "question": spec,
+            "itemId": item_ids[index] if index < len(item_ids) else None,
+        }
+        for index, spec in enumerate(specs)
+    ]
+
+
+def estimate_forms_calls(blueprint: Dict[str, Any]) -> int:
+    """Forms API requests create_form_from_blueprint will make for a blueprint."""
+    questions = blueprint.get("questions", [])
+    if not questions or _has_tool("google_forms", "add_questions"):
+        return 2
+    # create_form, a batchUpdate per question plus a get to clamp its index
+    # (none for index 0), then reorder_items' get and batchUpdate
+    return 2 * len(questions) + 2
+
+
+def _reorder_questions(form_id: str, created: List[Dict[str, Any]]) -> bool:
+    item_ids = [entry.get("itemId") for entry in created if entry["ok"]]
+    if not item_ids:
+        return True
+    if not all(item_ids):
+        return False
+    result = call_mcp_tool("google_forms", "reorder_items", {"formId": form_id, "itemIds": item_ids})
+    return _tool_error(result) is None
+
+
 def create_form_from_blueprint(blueprint: Dict[str, Any]) -> Dict[str, Any]:
     title = (blueprint.get("title") or "Survey").strip()
     description = (blueprint.get("description") or "").strip()
@@ -86,25 +424,17 @@ def create_form_from_blueprint(blueprint: Dict[str, Any]) -> Dict[str, Any]:
     if not form_id:
         return {"ok": False, "error": "form_create_failed", "raw": create_result}
 
-    created_questions = []
-    for question in blueprint.get("questions", []):
-        q_type = question.get("type")
-        if q_type == "multiple_choice":
-            payload = {
-                "formId": form_id,
-                "questionTitle": question.get("title"),
-                "options": question.get("options", []),
-                "required": bool(question.get("required", False)),
-            }
-            result = call_mcp_tool("google_forms", "add_multiple_choice_question", payload)
-        else:
-            payload = {
-                "formId": form_id,
-                "questionTitle": question.get("title"),
-                "required": bool(question.get("required", False)),
-            }
-            result = call_mcp_tool("google_forms", "add_text_question", payload)
-        created_questions.append({"question": payload, "result": result})
+    questions = blueprint.get("questions", [])
+    created_questions = None
+    if questions and _has_tool("google_forms", "add_questions"):
+        # One batchUpdate for the whole form; it is all-or-nothing, so when
+        # the server rejects it fall back to per-question calls to find the bad ones
+        created_questions = _add_questions_bulk(form_id, questions)
+    ordered = created_questions is not None
+    if created_questions is None:
+        created_questions = _add_questions(form_id, questions)
+        ordered = _reorder_questions(form_id, created_questions)
+    failed = [entry["index"] for entry in created_questions if not entry["ok"]]
 
     return {
         "ok": True,
@@ -113,4 +443,201 @@ def create_form_from_blueprint(blueprint: Dict[str, Any]) -> Dict[str, Any]:
         "title": title,
         "description": description,
         "questions": created_questions,
+        "failed_questions": failed,
+        "ordered": ordered,
     }
+
+
+class _FormPipeline:
+    """Creates the form and its questions on worker threads while the
+    blueprint is still being generated; progress is put on ``events``."""
+
+    def __init__(self, client: Any, limit: int) -> None:
+        self.client = client
+        self.events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        # The form task is always queued first, so question tasks waiting on
+        # it cannot starve it of a worker
+        self.executor = ThreadPoolExecutor(max_workers=max(1, limit))
+        self.form: Optional[Future] = None
+        self.pending: List[Future] = []
+        self.backlog: List[Tuple[int, Dict[str, Any]]] = []
+
+    def create_form(self, title: str) -> None:
+        if self.form is not None:
+            return
+        self.form = self.executor.submit(self._create_form, title)
+        for index, question in self.backlog:
+            self.add_question(index, question)
+        self.backlog = []
+
+    def add_question(self, index: int, question: Dict[str, Any]) -> None:
+        if self.form is None:
+            self.backlog.append((index, question))
+            return
+        self.pending.append(self.executor.submit(self._add_question, index, question))
+
+    def form_info(self) -> Dict[str, Any]:
+        return self.form.result() if self.form is not None else {}
+
+    def created(self) -> List[Dict[str, Any]]:
+        return sorted((future.result() for future in self.pending), key=lambda entry: entry["index"])
+
+    def drain(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            try:
+                yield self.events.get_nowait()
+            except queue.Empty:
+                return
+
+    def wait(self) -> Iterator[Dict[str, Any]]:
+        futures = ([self.form] if self.form is not None else []) + self.pending
+        while not all(future.done() for future in futures):
+            try:
+                yield self.events.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        yield from self.drain()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False)
+
+    def _create_form(self, title: str) -> Dict[str, Any]:
+        result = self.client.tool_call("create_form", {"title": title})
+        info = _extract_mcp_json(result)
+        if info.get("formId"):
+            self.events.put({"event": "form", "data": {
+                "formId": info["formId"],
+                "responderUri": info.get("responderUri"),
+                "title": title,
+            }})
+        else:
+            info = {"error": "form_create_failed", "raw": result}
+            self.events.put({"event": "error", "data": {"ok": False, **info}})
+        return info
+
+    def _add_question(self, index: int, question: Dict[str, Any]) -> Dict[str, Any]:
+        form_id = self.form.result().get("formId")
+        if not form_id:
+            entry = {"index": index, "ok": False, "question": question, "error": "form_create_failed"}
+        else:
+            tool, payload = _question_call(form_id, index, question)
+            entry = _question_entry(index, payload, self.client.tool_call(tool, payload))
+        self.events.put({
+            "event": "question_created",
+            "data": {name: value for name, value in entry.items() if name != "result"},
+        })
+        return entry
+
+
+def stream_form_generation(payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Generates a blueprint and builds the form from it as it streams in.
+
+    Yields ``{"event": ..., "data": ...}`` progress events. The form is created
+    as soon as the title has been generated and each question is sent to MCP
+    as soon as it is complete, so the total time is close to the longer of
+    generation and creation rather than their sum. The last event is ``done``.
+    """
+    started = time.perf_counter()
+    inputs = _parse_inputs(payload)
+    if not inputs["ok"]:
+        yield {"event": "error", "data": inputs}
+        return
+
+    client = get_clients().get("google_forms")
+    if client is None or not hasattr(client, "tool_call"):
+        error = "unknown_server" if client is None else "tool_call_not_supported"
+        yield {"event": "error", "data": {"ok": False, "error": error}}
+        return
+
+    key = _cache_key(inputs)
+    reused = None if _is_true(payload.get("fresh")) else _reuse_blueprint(inputs, key)
+    if reused is not None:
+        # Nothing to overlap with, so use the bulk path
+        yield {"event": "status", "data": {"stage": "cached"}}
+        created = create_form_from_blueprint(reused["blueprint"])
+        created.update(cached=True, elapsed_ms=round((time.perf_counter() - started) * 1000, 2))
+        if "similar" in reused:
+            created["similar"] = reused["similar"]
+        yield {"event": "done", "data": created}
+        return
+
+    pipeline = _FormPipeline(client, int(current_app.config.get("FORM_QUESTION_CONCURRENCY", 5)))
+    result: Dict[str, Any] = {"ok": True, "cached": False}
+
+    try:
+        yield {"event": "status", "data": {"stage": "generating"}}
+        parser = BlueprintStreamParser()
+        question_count = 0
+        for chunk in get_llm().stream(
+            _prompt_for(inputs),
+            label="form_blueprint_stream",
+            model=inputs["model"],
+            temperature=inputs["temperature"],
+            max_tokens=inputs["max_tokens"],
+        ):
+            if chunk["type"] == "error":
+                result = {"ok": False, "error": chunk["error"], "detail": chunk.get("detail")}
+                break
+            if chunk["type"] == "done":
+                result["usage"] = chunk["usage"]
+                result["max_output_tokens"] = chunk["max_output_tokens"]
+                result["truncated"] = chunk["truncated"]
+                result["first_token_ms"] = chunk["first_token_ms"]
+                break
+            for kind, value in parser.feed(chunk["text"]):
+                if kind == "question":
+                    question, _ = validate_question(value)
+                    if question is None or question_count >= inputs["num_questions"]:
+                        continue
+                    pipeline.add_question(question_count, question)
+                    yield {"event": "question", "data": {"index": question_count, "question": question}}
+                    question_count += 1
+                    continue
+                if kind == "title":
+                    pipeline.create_form(value.strip() or "Survey")
+                yield {"event": kind, "data": {"value": value}}
+            yield from pipeline.drain()
+
+        # Output cut off after some questions is still a usable, shorter form
+        blueprint, problems = validate_blueprint(parser.result(), inputs["num_questions"])
+        if blueprint is None:
+            blueprint = parser.result()
+            if result["ok"]:
+                REPAIR_STATS.count("failed")
+                result = {"ok": False, "error": "invalid_json_from_model", "problems": problems}
+        elif result["ok"]:
+            REPAIR_STATS.count("repaired" if problems or not parser.done else "valid")
+            # A cut-off stream still makes a form, but only a complete one is reused
+            if not parser.done:
+                result["truncated"] = True
+            if not result.get("truncated"):
+                _remember_blueprint(inputs, key, blueprint)
+        # Questions parsed before a missing or late title still get a form
+        if question_count:
+            pipeline.create_form((blueprint.get("title") or "Survey").strip())
+
+        yield {"event": "status", "data": {"stage": "creating"}}
+        yield from pipeline.wait()
+
+        form_info = pipeline.form_info()
+        created_questions = pipeline.created()
+        if form_info.get("formId"):
+            ordered = _reorder_questions(form_info["formId"], created_questions)
+        else:
+            ordered = False
+            if result["ok"]:
+                result = {"ok": False, "error": form_info.get("error", "form_create_failed")}
+
+        result.update({
+            "formId": form_info.get("formId"),
+            "responderUri": form_info.get("responderUri"),
+            "title": (blueprint.get("title") or "Survey").strip(),
+            "description": (blueprint.get("description") or "").strip(),
+            "questions": created_questions,
+            "failed_questions": [entry["index"] for entry in created_questions if not entry["ok"]],
+            "ordered": ordered,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        })
+        yield {"event": "done", "data": result}
+    finally:
+        pipeline.close()
@@ -0,0 +1,178 @@
+import copy
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "form_jobs"
+ACTIVE = ("queued", "running")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _public(job: Dict[str, Any]) -> Dict[str, Any]:
+    job = dict(job)
+    job["id"] = job.pop("_id")
+    job.pop("payload", None)
+    for field in ("created_at", "started_at", "finished_at"):
+        if isinstance(job.get(field), datetime):
+            job[field] = job[field].isoformat()
+    return job
+
+
+class FormJobQueue:
+    """Runs form generation jobs on a bounded pool of background workers.
+
+    Job state lives in the ``form_jobs`` collection so any web worker can
+    answer status requests; without a database it is kept in memory only.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        runner: Callable[[Dict[str, Any], Callable[[str], None]], Dict[str, Any]],
+        workers: int = 4,
+        queue_size: int = 100,
+        ttl: float = 604800.0,
+        history: int = 1000,
+    ) -> None:
+        self.app = app
+        self.runner = runner
+        self.workers = max(1, int(workers))
+        self.queue_size = max(0, int(queue_size))
+        self.ttl = float(ttl)
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="form-job")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._outstanding = 0
+        self._rejected = 0
+
+    @property
+    def db(self):
+        return getattr(self.app, "db", None)
+
+    def ensure_indexes(self) -> None:
+        if self.db is None:
+            return
+        if self.ttl <= 0:
+            return
+        try:
+            self.db[COLLECTION].create_index("created_at", expireAfterSeconds=int(self.ttl))
+        except Exception as e:
+            logger.warning(f"Could not prepare form job collection: {e}")
+
+    def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if self._outstanding >= self.workers + self.queue_size:
+                self._rejected += 1
+                return {"ok": False, "error": "queue_full"}
+            self._outstanding += 1
+
+        job = {
+            "_id": uuid.uuid4().hex,
+            "status": "queued",
+            "stage": None,
+            "payload": payload,
+            "result": None,
+            "error": None,
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+        }
+        self._save(job, insert=True)
+        # Workers update this dict once it is submitted, so answer with the queued state
+        public = _public(copy.deepcopy(job))
+        try:
+            self._executor.submit(self._run, job["_id"], payload)
+        except RuntimeError:
+            with self._lock:
+                self._outstanding -= 1
+            self._update(job["_id"], status="failed", error="shutting_down", finished_at=_now())
+            return {"ok": False, "error": "shutting_down"}
+        return {"ok": True, "job": public}
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return _public(copy.deepcopy(job))
+        if self.db is None:
+            return None
+        try:
+            job = self.db[COLLECTION].find_one({"_id": job_id}, {"payload": 0})
+        except Exception as e:
+            logger.warning(f"Error reading form job {job_id}: {e}")
+            return None
+        return _public(job) if job else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job["status"] == "running")
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "outstanding": self._outstanding,
+                "running": running,
+                "queued": self._outstanding - running,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _run(self, job_id: str, payload: Dict[str, Any]) -> None:
+        self._update(job_id, status="running", started_at=_now())
+        try:
+            with self.app.app_context():
+                result = self.runner(payload, lambda stage: self._update(job_id, stage=stage))
+            if result.get("ok"):
+                self._update(job_id, status="succeeded", result=result, finished_at=_now())
+            else:
+                self._update(job_id, status="failed", result=result, error=result.get("error"), finished_at=_now())
+        except Exception as e:
+            logger.exception(f"Form job {job_id} crashed")
+            self._update(job_id, status="failed", error=str(e) or "job_failed", finished_at=_now())
+        finally:
+            with self._lock:
+                self._outstanding -= 1
+
+    def _save(self, job: Dict[str, Any], insert: bool = False) -> None:
+        with self._lock:
+            self._jobs[job["_id"]] = job
+            self._jobs.move_to_end(job["_id"])
+            self._trim()
+        if insert and self.db is not None:
+            try:
+                self.db[COLLECTION].insert_one(dict(job))
+            except Exception as e:
+                logger.warning(f"Error storing form job {job['_id']}: {e}")
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        if self.db is not None:
+            try:
+                self.db[COLLECTION].update_one({"_id": job_id}, {"$set": fields})
+            except Exception as e:
+                logger.warning(f"Error updating form job {job_id}: {e}")
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields)
+            # Finished jobs are served from Mongo when it is available
+            if job["status"] not in ACTIVE and self.db is not None:
+                self._jobs.pop(job_id, None)
+
+    def _trim(self) -> None:
+        while len(self._jobs) > self.history:
+            oldest = next(iter(self._jobs))
+            if self._jobs[oldest]["status"] in ACTIVE:
+                break
+            self._jobs.popitem(last=False)
@@ -6,7 +6,12 @@ from google.oauth2 import id_token
 from google.auth import exceptions
 import jwt
 import datetime
-from .database_service import DatabaseService
+import re
+from pymongo.errors import DuplicateKeyError
+from .database_service import DatabaseService, duplicate_key_field
+
+# Attempts at picking a free username when concurrent sign-ups take the same one
+USERNAME_ATTEMPTS = 5
 
 # Load environment variables at module import
 load_dotenv()
@@ -82,11 +87,27 @@ class GoogleOAuthService:
     def check_user_exists(self, email):
         """Check if a user already exists with the given email"""
         try:
-            user = DatabaseService.find_one("users", {"email": email})
+            user = DatabaseService.find_one("users", {"email": email}, projection="exists")
             return user is not None
         except Exception as e:
             return False
 
+    def next_username(self, base):
+        """Returns ``base`` or the first free ``base<n>`` using one indexed query"""
+        pattern = f"^{re.escape(base)}(\\d*)$"
+        taken = set()
+        cursor = DatabaseService.get_db()["users"].find(
+            {"username": {"$regex": pattern}},
+            {"username": 1, "_id": 0},
+        )
+        for doc in cursor:
+            suffix = doc["username"][len(base):]
+            taken.add(int(suffix) if suffix else 0)
+        counter = 0
+        while counter in taken:
+            counter += 1
+        return base if counter == 0 else f"{base}{counter}"
+
     def create_google_user(self, google_user_info):
         """Create a new user from Google OAuth info"""
         try:
@@ -103,16 +124,22 @@ class GoogleOAuthService:
                 "last_login": datetime.datetime.utcnow()
             }
             
-            # Ensure username uniqueness
-            existing_user = DatabaseService.find_one("users", {"username": new_user["username"]})
-            counter = 1
+            # Ensure username uniqueness; the unique index settles any race
             original_username = new_user["username"]
-            while existing_user:
-                new_user["username"] = f"{original_username}{counter}"
-                existing_user = DatabaseService.find_one("users", {"username": new_user["username"]})
-                counter += 1
-            
-            user_id = DatabaseService.insert_one("users", new_user)
+            for attempt in range(USERNAME_ATTEMPTS):
+                new_user["username"] = self.next_username(original_username)
+                try:
+                    user_id = DatabaseService.insert_one("users", dict(new_user))
+                    break
+                except DuplicateKeyError as e:
+                    if duplicate_key_field(e) != "username":
+                        # Another request created this Google user first
+                        user = self.authenticate_google_user(google_user_info)
+                        if user is None:
+                            raise
+                        return user
+            else:
+                raise Exception("could not allocate a unique username")
             new_user["_id"] = user_id
             
             return new_user
@@ -124,11 +151,15 @@ class GoogleOAuthService:
         """Authenticate existing Google user and update login info"""
         try:
             # First try to find by google_id
-            user = DatabaseService.find_one("users", {"google_id": google_user_info['google_id']})
+            user = DatabaseService.find_one(
+                "users", {"google_id": google_user_info['google_id']}, projection="user_google"
+            )
             
             if not user:
                 # Then try to find by email
-                user = DatabaseService.find_one("users", {"email": google_user_info['email']})
+                user = DatabaseService.find_one(
+                    "users", {"email": google_user_info['email']}, projection="user_google"
+                )
             
             if not user:
                 return None
@@ -145,9 +176,10 @@ class GoogleOAuthService:
                 update_data["google_id"] = google_user_info['google_id']
                 update_data["auth_provider"] = "google"
             
+            # Also drops the cached profile, so the read below sees the new login
             DatabaseService.update_one("users", {"_id": user["_id"]}, update_data)
             
-            updated_user = DatabaseService.find_one("users", {"_id": user["_id"]})
+            updated_user = DatabaseService.find_one("users", {"_id": user["_id"]}, projection="user_public")
             return updated_user
             
         except Exception as e:
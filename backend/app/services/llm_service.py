@@ -0,0 +1,17 @@
+from typing import Any, Dict, List, Optional
+
+from flask import current_app
+
+from app.llm import LlmGateway
+
+
+def get_llm() -> LlmGateway:
+    return current_app.llm
+
+
+def generate_text(messages: List[Dict[str, str]], label: str = "", **options: Optional[Any]) -> Dict[str, Any]:
+    return get_llm().respond(messages, label=label, **options)
+
+
+def get_llm_stats() -> Dict[str, Any]:
+    return get_llm().stats()
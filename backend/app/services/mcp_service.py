@@ -1,20 +1,71 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from flask import current_app
 
-from app.mcp.registry import build_clients
+from app.mcp.metrics import MCP_METRICS, render_prometheus
+
+
+def get_clients() -> Dict[str, Any]:
+    return current_app.mcp_clients
 
 
 def get_mcp_status() -> Dict[str, Any]:
-    clients = build_clients(current_app.config)
+    monitor = getattr(current_app, "mcp_health", None)
+    if monitor is not None and monitor.running:
+        return monitor.snapshot()
+
+    clients = get_clients()
     status = {}
     for name, client in clients.items():
         status[name] = client.ping()
     return status
 
 
+def get_mcp_metrics() -> Dict[str, Any]:
+    stats = get_mcp_stats()
+    latency = MCP_METRICS.snapshot()
+    servers = {}
+    for name in set(stats) | set(latency):
+        server_stats = stats.get(name, {})
+        servers[name] = {
+            "in_flight": server_stats.get("in_flight", 0),
+            "rejected": server_stats.get("rejected", 0),
+            "late_responses": server_stats.get("late_responses", 0),
+            "crashes": server_stats.get("crashes", 0),
+            "restarts": server_stats.get("restarts", 0),
+            "tools": latency.get(name, {}),
+        }
+    return {"servers": servers}
+
+
+def get_mcp_metrics_prometheus() -> str:
+    return render_prometheus(MCP_METRICS.snapshot(), get_mcp_stats())
+
+
+def get_mcp_readiness() -> Dict[str, Any]:
+    warmup = getattr(current_app, "mcp_warmup", None)
+    if warmup is None:
+        return {"ready": True, "servers": {}}
+    return {"ready": warmup.ready, "servers": warmup.snapshot()}
+
+
+def list_mcp_tools(server: str, force: bool = False) -> Dict[str, Any]:
+    clients = get_clients()
+    client = clients.get(server)
+    if not client:
+        return {"ok": False, "error": "unknown_server"}
+    if not hasattr(client, "list_tools"):
+        return client.call("tools/list", {})
+    return client.list_tools(force)
+
+
+def get_mcp_stats() -> Dict[str, Any]:
+    clients = get_clients()
+    return {name: client.stats() for name, client in clients.items()}
+
+
 def call_mcp(server: str, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    clients = build_clients(current_app.config)
+    clients = get_clients()
     client = clients.get(server)
     if not client:
         return {"ok": False, "error": "unknown_server"}
@@ -22,10 +73,22 @@ def call_mcp(server: str, method: str, params: Dict[str, Any]) -> Dict[str, Any]
 
 
 def call_mcp_tool(server: str, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-    clients = build_clients(current_app.config)
+    clients = get_clients()
     client = clients.get(server)
     if not client:
         return {"ok": False, "error": "unknown_server"}
     if not hasattr(client, "tool_call"):
         return {"ok": False, "error": "tool_call_not_supported"}
     return client.tool_call(tool, arguments)
+
+
+def call_mcp_tools(server: str, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    clients = get_clients()
+    client = clients.get(server)
+    if not client:
+        return [{"ok": False, "error": "unknown_server"} for _ in calls]
+    if hasattr(client, "tool_call_many"):
+        return client.tool_call_many(calls)
+    if not hasattr(client, "tool_call"):
+        return [{"ok": False, "error": "tool_call_not_supported"} for _ in calls]
+    return [client.tool_call(tool, arguments) for tool, arguments in calls]
@@ -0,0 +1,64 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class UserCache:
+    """In-process TTL/LRU cache of public user profiles keyed by id.
+
+    Writes through ``DatabaseService`` invalidate entries. Changes made
+    outside the app show up once an entry's TTL runs out.
+    """
+
+    def __init__(self, size: int = 10000, ttl: float = 60.0) -> None:
+        self.size = max(0, int(size))
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._epoch = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and self.ttl > 0
+
+    @property
+    def epoch(self) -> int:
+        """Taken before a database read and handed back to ``set``"""
+        with self._lock:
+            return self._epoch
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                return copy.deepcopy(entry[1])
+            if entry is not None:
+                del self._entries[user_id]
+        return None
+
+    def set(self, user_id: str, user: Dict[str, Any], epoch: int) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            # Something was invalidated while this copy was being read; it may be stale
+            if epoch != self._epoch:
+                return
+            self._entries[user_id] = (time.time() + self.ttl, copy.deepcopy(user))
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drops one user, or everything when the id is not known"""
+        with self._lock:
+            self._epoch += 1
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
@@ -0,0 +1,64 @@
+"""
+Token bucket rate limiter shared by callers of a quota-limited API
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """Allows ``rate`` tokens per second with bursts of up to ``capacity``.
+
+    ``acquire`` blocks until enough tokens are available, so concurrent
+    callers are spread out to the configured rate instead of failing. A
+    request for more than ``capacity`` is charged in full; the balance goes
+    negative and later callers wait until it has been paid back. A rate
+    of 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = max(0.0, float(rate))
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0.0
+        self._waited = 0.0
+
+    @classmethod
+    def per_minute(cls, limit: float) -> "TokenBucket":
+        # Burst a tenth of the minute's budget so a batch does not spend it all at once
+        return cls(limit / 60.0, capacity=max(1.0, limit / 10.0))
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        if self.rate <= 0:
+            return True
+        tokens = float(tokens)
+        # A request larger than the bucket waits for a full bucket and then
+        # overdraws it, so the callers after it wait off the remainder
+        needed = min(tokens, self.capacity)
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    self._acquired += tokens
+                    self._waited += now - started
+                    return True
+                wait = (needed - self._tokens) / self.rate
+            if timeout is not None and now - started + wait > timeout:
+                return False
+            time.sleep(wait)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate_per_minute": round(self.rate * 60, 2),
+                "capacity": self.capacity,
+                "available": round(min(self.capacity, self._tokens + (time.monotonic() - self._updated) * self.rate), 2),
+                "acquired": self._acquired,
+                "waited_seconds": round(self._waited, 3),
+            }
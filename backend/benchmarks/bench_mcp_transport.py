@@ -0,0 +1,95 @@
+"""Microbenchmark for the MCP stdio read path on large tool results.
+
+Compares the old transport (text-mode pipes decoded as UTF-8, stdlib json)
+against the current one (bytes-mode pipes, app.mcp.codec), reporting the
+reader's own CPU time per run. Run from backend/:
+
+    python -m benchmarks.bench_mcp_transport --size 500000 --count 200
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from typing import Tuple
+
+from app.mcp import codec
+from app.mcp.stdio_client import PIPE_BUFFER_SIZE
+
+# Child process that prints COUNT JSON-RPC responses shaped like get_form_responses.
+# "text" wraps the data in a text content block the way google-forms-mcp does today;
+# "structured" sends it as plain JSON objects.
+_EMITTER = r"""
+import json, sys
+size, count, shape = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+responses = [{"responseId": f"r{i}", "answers": {"q": {"textAnswers": {"answers": [{"value": "Cà phê ngon " * 4}]}}}} for i in range(size // 120)]
+if shape == "text":
+    result = {"content": [{"type": "text", "text": json.dumps({"responses": responses}, ensure_ascii=False, indent=2)}]}
+else:
+    result = {"structuredContent": {"responses": responses}}
+line = json.dumps({"jsonrpc": "2.0", "id": "x", "result": result}, ensure_ascii=False)
+out = sys.stdout.buffer
+data = (line + "\n").encode("utf-8")
+for _ in range(count):
+    out.write(data)
+out.flush()
+"""
+
+
+def _read_text_stdlib(size: int, count: int, shape: str) -> Tuple[float, float]:
+    process = subprocess.Popen(
+        [sys.executable, "-c", _EMITTER, str(size), str(count), shape],
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    started, cpu_started = time.perf_counter(), time.process_time()
+    for line in iter(process.stdout.readline, ""):
+        json.loads(line)
+    elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+    process.wait()
+    return elapsed, cpu
+
+
+def _read_bytes_codec(size: int, count: int, shape: str) -> Tuple[float, float]:
+    process = subprocess.Popen(
+        [sys.executable, "-c", _EMITTER, str(size), str(count), shape],
+        bufsize=PIPE_BUFFER_SIZE,
+        stdout=subprocess.PIPE,
+    )
+    started, cpu_started = time.perf_counter(), time.process_time()
+    for line in iter(process.stdout.readline, b""):
+        codec.loads(line)
+    elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+    process.wait()
+    return elapsed, cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=500_000, help="approximate bytes per tool result")
+    parser.add_argument("--count", type=int, default=200, help="responses per run")
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args()
+
+    total_mb = options.size * options.count / 1_000_000
+    print(f"codec={codec.CODEC_NAME} size~{options.size}B count={options.count} (~{total_mb:.0f} MB per run)")
+    for shape in ("text", "structured"):
+        print(f"[{shape} tool result]")
+        for label, runner in (
+            ("text + json (before)", _read_text_stdlib),
+            (f"bytes + {codec.CODEC_NAME} (after)", _read_bytes_codec),
+        ):
+            _report(label, [runner(options.size, options.count, shape) for _ in range(options.repeat)], total_mb)
+
+
+def _report(label: str, runs, total_mb: float) -> None:
+    wall = min(run[0] for run in runs)
+    cpu = min(run[1] for run in runs)
+    # CPU time is the reader's own cost; wall time also includes waiting on the emitter
+    print(f"  {label:<28} wall {wall:.3f}s  cpu {cpu:.3f}s  {total_mb / cpu:8.1f} MB/s of CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -101,6 +101,10 @@ class GoogleFormsServer {
               required: {
                 type: 'boolean',
                 description: 'Whether required (optional, default is false)',
+              },
+              index: {
+                type: 'number',
+                description: 'Position to insert the question at (optional, default is 0; clamped to the current item count)',
               }
             },
             required: ['formId', 'questionTitle'],
@@ -130,11 +134,84 @@ class GoogleFormsServer {
               required: {
                 type: 'boolean',
                 description: 'Whether required (optional, default is false)',
+              },
+              index: {
+                type: 'number',
+                description: 'Position to insert the question at (optional, default is 0; clamped to the current item count)',
               }
             },
             required: ['formId', 'questionTitle', 'options'],
           },
         },
+        {
+          name: 'add_questions',
+          description: 'Add several text and multiple choice questions to the form in one update',
+          inputSchema: {
+            type: 'object',
+            properties: {
+              formId: {
+                type: 'string',
+                description: 'Form ID',
+              },
+              questions: {
+                type: 'array',
+                items: {
+                  type: 'object',
+                  properties: {
+                    type: {
+                      type: 'string',
+                      enum: ['text', 'multiple_choice'],
+                      description: 'Question type (optional, default is text)',
+                    },
+                    questionTitle: {
+                      type: 'string',
+                      description: 'Question title',
+                    },
+                    options: {
+                      type: 'array',
+                      items: {
+                        type: 'string'
+                      },
+                      description: 'Array of choices (multiple_choice only)',
+                    },
+                    required: {
+                      type: 'boolean',
+                      description: 'Whether required (optional, default is false)',
+                    }
+                  },
+                  required: ['questionTitle'],
+                },
+                description: 'Questions in the order they should appear',
+              },
+              index: {
+                type: 'number',
+                description: 'Position of the first question (optional, default is 0)',
+              }
+            },
+            required: ['formId', 'questions'],
+          },
+        },
+        {
+          name: 'reorder_items',
+          description: 'Move the given items to the top of the form in the given order',
+          inputSchema: {
+            type: 'object',
+            properties: {
+              formId: {
+                type: 'string',
+                description: 'Form ID',
+              },
+              itemIds: {
+                type: 'array',
+                items: {
+                  type: 'string'
+                },
+                description: 'Item IDs in the desired order',
+              }
+            },
+            required: ['formId', 'itemIds'],
+          },
+        },
         {
           name: 'get_form',
           description: 'Get form details',
@@ -175,6 +252,10 @@ class GoogleFormsServer {
             return await this.addTextQuestion(request.params.arguments);
           case 'add_multiple_choice_question':
             return await this.addMultipleChoiceQuestion(request.params.arguments);
+          case 'add_questions':
+            return await this.addQuestions(request.params.arguments);
+          case 'reorder_items':
+            return await this.reorderItems(request.params.arguments);
           case 'get_form':
             return await this.getForm(request.params.arguments);
           case 'get_form_responses':
@@ -255,10 +336,7 @@ class GoogleFormsServer {
     }
 
     try {
-      // Get the current form
-      const form = await this.forms.forms.get({
-        formId: args.formId,
-      });
+      const index = await this.resolveIndex(args.formId, args.index);
 
       // Create a request to add a new question
       const updateRequest = {
@@ -275,7 +353,7 @@ class GoogleFormsServer {
                 }
               },
               location: {
-                index: 0
+                index
               }
             }
           }
@@ -295,6 +373,8 @@ class GoogleFormsServer {
             text: JSON.stringify({
               success: true,
               message: 'Text question added successfully',
+              itemId: response.data.replies?.[0]?.createItem?.itemId,
+              index,
               questionTitle: args.questionTitle,
               required: args.required || false,
             }, null, 2),
@@ -319,6 +399,8 @@ class GoogleFormsServer {
     }
 
     try {
+      const index = await this.resolveIndex(args.formId, args.index);
+
       // Create choices
       const choices = args.options.map((option: string) => ({
         value: option
@@ -342,7 +424,7 @@ class GoogleFormsServer {
                 }
               },
               location: {
-                index: 0
+                index
               }
             }
           }
@@ -362,6 +444,8 @@ class GoogleFormsServer {
             text: JSON.stringify({
               success: true,
               message: 'Multiple choice question added successfully',
+              itemId: response.data.replies?.[0]?.createItem?.itemId,
+              index,
               questionTitle: args.questionTitle,
               options: args.options,
               required: args.required || false,
@@ -378,6 +462,170 @@ class GoogleFormsServer {
     }
   }
 
+  private async addQuestions(args: any) {
+    if (!args.formId || !args.questions || !Array.isArray(args.questions)) {
+      throw new McpError(
+        ErrorCode.InvalidParams,
+        'Form ID and questions array are required'
+      );
+    }
+
+    const start = typeof args.index === 'number' && args.index > 0 ? Math.floor(args.index) : 0;
+
+    // Requests in one batchUpdate apply in order, so consecutive indexes keep
+    // the questions in the order they were given
+    const requests = args.questions.map((question: any, offset: number) => {
+      if (!question || !question.questionTitle) {
+        throw new McpError(
+          ErrorCode.InvalidParams,
+          `Question ${offset} is missing questionTitle`
+        );
+      }
+
+      const body: any = {
+        required: question.required || false,
+      };
+      if (question.type === 'multiple_choice') {
+        if (!Array.isArray(question.options) || question.options.length === 0) {
+          throw new McpError(
+            ErrorCode.InvalidParams,
+            `Question ${offset} needs an options array`
+          );
+        }
+        body.choiceQuestion = {
+          type: 'RADIO',
+          options: question.options.map((option: string) => ({
+            value: option
+          })),
+        };
+      } else {
+        body.textQuestion = {};
+      }
+
+      return {
+        createItem: {
+          item: {
+            title: question.questionTitle,
+            questionItem: {
+              question: body
+            }
+          },
+          location: {
+            index: start + offset
+          }
+        }
+      };
+    });
+
+    if (requests.length === 0) {
+      throw new McpError(ErrorCode.InvalidParams, 'At least one question is required');
+    }
+
+    try {
+      const response = await this.forms.forms.batchUpdate({
+        formId: args.formId,
+        requestBody: { requests },
+      });
+
+      const replies = response.data.replies || [];
+      return {
+        content: [
+          {
+            type: 'text',
+            text: JSON.stringify({
+              success: true,
+              message: `${requests.length} questions added successfully`,
+              itemIds: replies.map((reply: any) => reply.createItem?.itemId),
+            }, null, 2),
+          },
+        ],
+      };
+    } catch (error: any) {
+      console.error('Error adding questions:', error);
+      throw new McpError(
+        ErrorCode.InternalError,
+        `Failed to add questions: ${error.message}`
+      );
+    }
+  }
+
+  // Questions may be added concurrently, so an explicit index is clamped to
+  // the items that exist right now; reorder_items fixes up the final order.
+  private async resolveIndex(formId: string, index: any): Promise<number> {
+    if (typeof index !== 'number' || index <= 0) {
+      return 0;
+    }
+    const form = await this.forms.forms.get({
+      formId,
+    });
+    const count = (form.data.items || []).length;
+    return Math.min(Math.floor(index), count);
+  }
+
+  private async reorderItems(args: any) {
+    if (!args.formId || !args.itemIds || !Array.isArray(args.itemIds)) {
+      throw new McpError(
+        ErrorCode.InvalidParams,
+        'Form ID and itemIds array are required'
+      );
+    }
+
+    try {
+      const form = await this.forms.forms.get({
+        formId: args.formId,
+      });
+      const current: string[] = (form.data.items || []).map((item: any) => item.itemId);
+
+      // Walk the target order and emit a move for every item out of place,
+      // tracking positions locally so all moves fit in one batchUpdate
+      const requests: any[] = [];
+      let position = 0;
+      for (const itemId of args.itemIds) {
+        const from = current.indexOf(itemId);
+        if (from === -1) {
+          continue;
+        }
+        if (from !== position) {
+          requests.push({
+            moveItem: {
+              originalLocation: { index: from },
+              newLocation: { index: position },
+            }
+          });
+          current.splice(from, 1);
+          current.splice(position, 0, itemId);
+        }
+        position += 1;
+      }
+
+      if (requests.length > 0) {
+        await this.forms.forms.batchUpdate({
+          formId: args.formId,
+          requestBody: { requests },
+        });
+      }
+
+      return {
+        content: [
+          {
+            type: 'text',
+            text: JSON.stringify({
+              success: true,
+              moved: requests.length,
+              itemIds: current,
+            }, null, 2),
+          },
+        ],
+      };
+    } catch (error: any) {
+      console.error('Error reordering items:', error);
+      throw new McpError(
+        ErrorCode.InternalError,
+        `Failed to reorder items: ${error.message}`
+      );
+    }
+  }
+
   private async getForm(args: any) {
     if (!args.formId) {
       throw new McpError(ErrorCode.InvalidParams, 'Form ID is required');